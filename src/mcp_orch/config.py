@@ -130,6 +130,7 @@ class MCPSessionConfig(BaseModel):
     Controls the behavior of persistent MCP server sessions including:
     - How long to keep unused sessions alive
     - How frequently to check for expired sessions
+    - How many sessions may be open at once
     """
     
     # Session timeout: How long to keep unused sessions alive (in minutes)
@@ -147,6 +148,14 @@ class MCPSessionConfig(BaseModel):
         default=5,
         description="Cleanup interval in minutes - how often to check for expired sessions"
     )
+    
+    # Max sessions: Upper bound on concurrently open sessions (subprocesses / SSE connections)
+    # Environment variable: MCP_SESSION_MAX_SESSIONS
+    # Default: 128 sessions (least recently used session is closed when exceeded)
+    max_sessions: int = Field(
+        default=128,
+        description="Maximum number of open sessions - the least recently used session is closed when a new one would exceed it"
+    )
 
 
 class Settings(BaseSettings):
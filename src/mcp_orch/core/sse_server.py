@@ -153,9 +153,10 @@ class SSEMCPServer:
             raise
         except Exception as e:
             logger.error(f"SSE connection error for {self.config.name}: {e}")
-            self.is_connected = False
             raise
         finally:
+            # 스트림이 정상 종료된 경우에도 연결 끊김으로 표시
+            self.is_connected = False
             await self._cleanup_pending_requests("SSE connection terminated")
     
     async def _handle_sse_event(self, event) -> None:
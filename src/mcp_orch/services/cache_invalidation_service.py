@@ -8,6 +8,8 @@ import logging
 from typing import Optional, Dict, Any
 from uuid import UUID
 
+from .tool_filtering_service import ToolFilteringService
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,8 +32,9 @@ class CacheInvalidationService:
         """
         
         try:
-            # 1. 🔧 MCP 세션 매니저 캐시 무효화 (기존 시스템 통합)
+            # 1. 🔧 MCP 세션 매니저 캐시 및 툴 설정 캐시 무효화 (기존 시스템 통합)
             await CacheInvalidationService._invalidate_session_cache(project_id, server_id)
+            await ToolFilteringService.invalidate_cache(project_id, server_id)
             
             # 2. 🗄️ PostgreSQL Materialized View 새로고침 (향후 적용)
             # await CacheInvalidationService._refresh_materialized_views(project_id, server_id)
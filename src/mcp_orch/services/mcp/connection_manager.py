@@ -11,45 +11,120 @@ Extracted from mcp_connection_service.py to follow Single Responsibility Princip
 """
 
 import asyncio
-import json
 import logging
 import os
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Set, Tuple, Union
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # SSE connection tests require aiohttp
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # Optional HTTP/2 backend for SSE connection tests
+
+from ...utils import json_codec
 from .interfaces import IMcpConnectionManager
 from .error_handler import McpErrorHandler
 
 
 logger = logging.getLogger(__name__)
 
+# Exceptions raised by whichever HTTP client libraries are installed
+_HTTP_TIMEOUT_ERRORS = (asyncio.TimeoutError,) + ((httpx.TimeoutException,) if httpx else ())
+_HTTP_CLIENT_ERRORS = tuple(
+    error for error in (
+        aiohttp.ClientError if aiohttp else None,
+        httpx.HTTPError if httpx else None,
+    ) if error is not None
+)
+
+# SSE HTTP client backends: "aiohttp" (default) or "httpx" (HTTP/2 when h2 is installed)
+HTTP_BACKENDS = ("aiohttp", "httpx")
+
+
+def _resolve_http_backend(http_backend: Optional[str]) -> str:
+    """Validate the HTTP backend name, falling back to the MCP_HTTP_BACKEND env var"""
+    backend = (http_backend or os.getenv('MCP_HTTP_BACKEND', 'aiohttp')).lower()
+    if backend not in HTTP_BACKENDS:
+        raise ValueError(f"Invalid HTTP backend: {backend}. Must be one of {list(HTTP_BACKENDS)}")
+    return backend
+
+
+@dataclass(frozen=True, slots=True)
+class ServerConfig:
+    """Normalized, read-only view of a server configuration dictionary"""
+    id: str = 'unknown'
+    transport_type: str = 'stdio'
+    command: str = ''
+    args: Tuple[str, ...] = ()
+    env: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    timeout: float = 10
+    url: str = ''
+    headers: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ServerConfig':
+        """Create ServerConfig from a server configuration dictionary"""
+        return cls(
+            id=data.get('id', 'unknown'),
+            transport_type=data.get('transport_type', 'stdio'),
+            command=data.get('command', ''),
+            args=tuple(data.get('args') or ()),
+            env=MappingProxyType(dict(data.get('env') or {})),
+            timeout=data.get('timeout', 10),
+            url=data.get('url') or '',
+            headers=MappingProxyType(dict(data.get('headers') or {}))
+        )
+
 
 class McpConnection:
     """Represents an active MCP server connection"""
     
-    def __init__(self, server_id: str, server_config: Dict, process: asyncio.subprocess.Process):
+    def __init__(
+        self,
+        server_id: str,
+        server_config: Dict,
+        process: asyncio.subprocess.Process,
+        config: Optional[ServerConfig] = None
+    ):
         self.server_id = server_id
         self.server_config = server_config
+        self.config = config or ServerConfig.from_dict(server_config)
         self.process = process
-        self.created_at = datetime.now()
-        self.last_used_at = datetime.now()
+        # Monotonic timestamps for age/idle accounting
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
         self.is_healthy = True
+        # Number of requests currently using this connection (never evicted while > 0)
+        self.in_flight = 0
+        # Task that removes the connection from the pool when its process exits
+        self.exit_watcher: Optional[asyncio.Task] = None
         
     def touch(self):
         """Update last used timestamp"""
-        self.last_used_at = datetime.now()
+        self.last_used_at = time.monotonic()
     
-    async def is_alive(self) -> bool:
-        """Check if the underlying process is still alive"""
+    def is_alive_fast(self) -> bool:
+        """Synchronous liveness check using attribute reads only (no awaits)"""
         # SSE 서버는 process가 없으므로 server_config로 판단
-        if self.server_config.get('transport_type') == 'sse':
+        if self.config.transport_type == 'sse':
             # SSE 연결은 항상 "alive"로 간주 (실제 테스트는 요청 시점에)
             return True
         
         # stdio 서버는 process 상태 확인
-        if self.process is None:
-            return False
-        return self.process.returncode is None
+        return self.process is not None and self.process.returncode is None
+    
+    async def is_alive(self) -> bool:
+        """Check if the underlying process is still alive"""
+        return self.is_alive_fast()
 
 
 class McpConnectionManager(IMcpConnectionManager):
@@ -60,9 +135,31 @@ class McpConnectionManager(IMcpConnectionManager):
     and connection health monitoring.
     """
     
-    def __init__(self, error_handler: Optional[McpErrorHandler] = None):
-        self.active_connections: Dict[str, McpConnection] = {}
+    # Connection pool limits (LRU cap and idle recycling)
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_IDLE_TIMEOUT = 600.0  # seconds
+    IDLE_SWEEP_INTERVAL = 30.0  # seconds
+    
+    def __init__(
+        self,
+        error_handler: Optional[McpErrorHandler] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        http_backend: Optional[str] = None
+    ):
+        # Ordered by recency of use: oldest first, most recently used last
+        self.active_connections: "OrderedDict[str, McpConnection]" = OrderedDict()
         self.error_handler = error_handler or McpErrorHandler()
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self._sweeper: Optional[asyncio.Task] = None
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+        # Tasks holding or waiting on each connect lock; the lock is dropped when this reaches 0
+        self._connect_lock_refs: Dict[str, int] = {}
+        # Background disconnects started by LRU eviction (strong refs until done)
+        self._eviction_tasks: Set[asyncio.Task] = set()
+        self.http_backend = _resolve_http_backend(http_backend)
+        self._http_session: Optional[Any] = None
         
     async def connect(self, server_config: Dict) -> McpConnection:
         """
@@ -79,33 +176,69 @@ class McpConnectionManager(IMcpConnectionManager):
         """
         try:
             server_id = server_config.get('id', 'unknown')
+            self._ensure_sweeper()
             
             # Check if we already have an active connection
-            if server_id in self.active_connections:
-                existing_conn = self.active_connections[server_id]
-                if await existing_conn.is_alive():
-                    existing_conn.touch()
-                    logger.debug(f"♻️ Reusing existing connection for server {server_id}")
+            existing_conn = self._reuse_connection(server_id)
+            if existing_conn is not None:
+                return existing_conn
+            
+            # Single-flight: only one task creates the connection for a given server
+            async with self._connect_lock(server_id):
+                # Another task may have connected while we were waiting
+                existing_conn = self._reuse_connection(server_id)
+                if existing_conn is not None:
                     return existing_conn
-                else:
+                
+                if server_id in self.active_connections:
                     # Clean up dead connection
-                    logger.warning(f"🧹 Cleaning up dead connection for server {server_id}")
+                    logger.warning("🧹 Cleaning up dead connection for server %s", server_id)
                     await self._cleanup_connection(server_id)
-            
-            # Create new connection
-            logger.info(f"🔗 Creating new connection for server {server_id}")
-            connection = await self._create_new_connection(server_config)
-            
-            # Store connection for reuse
-            self.active_connections[server_id] = connection
-            
-            return connection
+                
+                # Create new connection
+                logger.info("🔗 Creating new connection for server %s", server_id)
+                connection = await self._create_new_connection(server_config)
+                
+                # Store connection for reuse
+                self.active_connections[server_id] = connection
+                self._evict_over_capacity()
+                
+                return connection
             
         except Exception as e:
             error_msg = f"Failed to connect to MCP server {server_config.get('id', 'unknown')}: {e}"
             logger.error(error_msg)
             raise self.error_handler.create_tool_execution_error(error_msg, "CONNECTION_FAILED", {"server_config": server_config})
     
+    @asynccontextmanager
+    async def _connect_lock(self, server_id: str):
+        """Hold the per-server connect lock, dropping it once no task holds or waits on it"""
+        lock = self._connect_locks.get(server_id)
+        if lock is None:
+            lock = self._connect_locks[server_id] = asyncio.Lock()
+        # Count before acquiring so a woken waiter keeps the lock alive until it re-acquires
+        self._connect_lock_refs[server_id] = self._connect_lock_refs.get(server_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            remaining = self._connect_lock_refs[server_id] - 1
+            if remaining:
+                self._connect_lock_refs[server_id] = remaining
+            else:
+                del self._connect_lock_refs[server_id]
+                del self._connect_locks[server_id]
+    
+    def _reuse_connection(self, server_id: str) -> Optional[McpConnection]:
+        """Return the pooled connection for server_id if it is still alive"""
+        existing_conn = self.active_connections.get(server_id)
+        if existing_conn is not None and existing_conn.is_alive_fast():
+            existing_conn.touch()
+            self.active_connections.move_to_end(server_id)
+            logger.debug("♻️ Reusing existing connection for server %s", server_id)
+            return existing_conn
+        return None
+    
     async def disconnect(self, connection: McpConnection) -> None:
         """
         Close connection to MCP server
@@ -114,26 +247,89 @@ class McpConnectionManager(IMcpConnectionManager):
             connection: Connection to close
         """
         try:
-            if connection.server_id in self.active_connections:
-                del self.active_connections[connection.server_id]
+            if connection.exit_watcher is not None:
+                connection.exit_watcher.cancel()
+                connection.exit_watcher = None
+            
+            self._forget_connection(connection)
             
             if connection.process and connection.process.returncode is None:
-                logger.info(f"🔌 Disconnecting from server {connection.server_id}")
+                logger.info("🔌 Disconnecting from server %s", connection.server_id)
                 
-                # Graceful shutdown
-                if connection.process.stdin:
-                    connection.process.stdin.close()
-                
-                # Wait for process to terminate gracefully
-                try:
-                    await asyncio.wait_for(connection.process.wait(), timeout=5.0)
-                except asyncio.TimeoutError:
-                    logger.warning(f"⚠️ Force killing server process {connection.server_id}")
-                    connection.process.kill()
-                    await connection.process.wait()
+                # Shield the shutdown so a cancelled caller cannot leak the subprocess
+                await asyncio.shield(self._shutdown_process(connection))
                     
         except Exception as e:
-            logger.error(f"Error disconnecting from server {connection.server_id}: {e}")
+            logger.error("Error disconnecting from server %s: %s", connection.server_id, e)
+    
+    def _forget_connection(self, connection: McpConnection) -> None:
+        """Remove a connection from the pool if the entry still refers to it"""
+        if self.active_connections.get(connection.server_id) is connection:
+            del self.active_connections[connection.server_id]
+    
+    async def _watch_exit(self, connection: McpConnection) -> None:
+        """Drop the connection from the pool as soon as its process exits"""
+        returncode = await connection.process.wait()
+        connection.exit_watcher = None
+        if self.active_connections.get(connection.server_id) is connection:
+            logger.info("💀 Server process %s exited with code %s", connection.server_id, returncode)
+            self._forget_connection(connection)
+    
+    async def _shutdown_process(self, connection: McpConnection) -> None:
+        """Gracefully stop a stdio server process, force killing it on timeout"""
+        # Graceful shutdown
+        if connection.process.stdin:
+            connection.process.stdin.close()
+        
+        # Wait for process to terminate gracefully
+        try:
+            await asyncio.wait_for(connection.process.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            logger.warning("⚠️ Force killing server process %s", connection.server_id)
+            connection.process.kill()
+            await connection.process.wait()
+    
+    async def _shutdown_processes(self, connections: List[McpConnection]) -> None:
+        """
+        Stop many stdio server processes concurrently
+        
+        All processes get SIGTERM at once and share a single graceful-wait
+        deadline; any still running afterwards are killed together.
+        """
+        running = [
+            connection for connection in connections
+            if connection.process and connection.process.returncode is None
+        ]
+        if not running:
+            return
+        
+        # Phase 1: close stdin and request termination without waiting
+        for connection in running:
+            logger.info("🔌 Disconnecting from server %s", connection.server_id)
+            try:
+                if connection.process.stdin:
+                    connection.process.stdin.close()
+                connection.process.terminate()
+            except ProcessLookupError:
+                pass
+        
+        # Phase 2: wait for all of them under one shared deadline
+        wait_tasks = {
+            asyncio.ensure_future(connection.process.wait()): connection
+            for connection in running
+        }
+        _, pending = await asyncio.wait(wait_tasks, timeout=5.0)
+        
+        # Phase 3: force kill the stragglers together
+        for task in pending:
+            connection = wait_tasks[task]
+            logger.warning("⚠️ Force killing server process %s", connection.server_id)
+            try:
+                connection.process.kill()
+            except ProcessLookupError:
+                pass
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
     
     async def test_connection(self, server_config: Dict) -> bool:
         """
@@ -146,19 +342,17 @@ class McpConnectionManager(IMcpConnectionManager):
             bool: True if connection test succeeds
         """
         try:
-            transport_type = server_config.get('transport_type', 'stdio')
+            config = ServerConfig.from_dict(server_config)
             
             # SSE 서버 연결 테스트
-            if transport_type == 'sse':
-                return await self._test_sse_connection(server_config)
+            if config.transport_type == 'sse':
+                return await self._test_sse_connection(config)
             
             # stdio 서버 연결 테스트 (기존 로직)
-            command = server_config.get('command', '')
-            args = server_config.get('args', [])
-            env = server_config.get('env', {})
-            timeout = server_config.get('timeout', 10)
+            command, args, env, timeout = config.command, config.args, config.env, config.timeout
             
-            logger.debug(f"🔍 Testing MCP connection: {command} {' '.join(args)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔍 Testing MCP connection: %s %s", command, ' '.join(args))
             
             if not command:
                 logger.warning("❌ No command specified for MCP server")
@@ -191,12 +385,12 @@ class McpConnectionManager(IMcpConnectionManager):
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env=full_env
+                env=full_env,
+                close_fds=False
             )
             
             # Send initialization message
-            init_json = json.dumps(init_message) + '\n'
-            process.stdin.write(init_json.encode())
+            process.stdin.write(json_codec.dumps(init_message) + b'\n')
             await process.stdin.drain()
             
             # Wait for response with timeout
@@ -206,25 +400,24 @@ class McpConnectionManager(IMcpConnectionManager):
                 )
                 
                 if process.returncode == 0:
-                    # Parse response
-                    response_lines = stdout_data.decode().strip().split('\n')
-                    logger.debug(f"📥 MCP server response lines: {len(response_lines)}")
-                    
-                    for line in response_lines:
-                        if line.strip():
-                            try:
-                                response = json.loads(line)
-                                if response.get('id') == 1 and 'result' in response:
-                                    logger.debug("✅ MCP connection test successful")
-                                    return True
-                            except json.JSONDecodeError:
-                                logger.debug(f"⚠️ Failed to parse JSON: {line[:100]}")
-                                continue
+                    # Parse response line by line (bytes, no intermediate decode/split list)
+                    # and stop at the first matching initialize response
+                    for line in stdout_data.splitlines():
+                        if not line.strip():
+                            continue
+                        try:
+                            response = json_codec.loads(line)
+                        except json_codec.JSONDecodeError:
+                            logger.debug("⚠️ Failed to parse JSON: %r", line[:100])
+                            continue
+                        if isinstance(response, dict) and response.get('id') == 1 and 'result' in response:
+                            logger.debug("✅ MCP connection test successful")
+                            return True
                 
                 logger.debug("❌ MCP connection test failed - no valid response")
                 if stderr_data:
                     error_msg = self.error_handler.extract_meaningful_error(stderr_data.decode())
-                    logger.debug(f"Error details: {error_msg}")
+                    logger.debug("Error details: %s", error_msg)
                 
                 return False
                 
@@ -235,81 +428,73 @@ class McpConnectionManager(IMcpConnectionManager):
                 return False
                 
         except Exception as e:
-            logger.error(f"MCP connection test failed: {e}")
+            logger.error("MCP connection test failed: %s", e)
             return False
     
-    async def _test_sse_connection(self, server_config: Dict) -> bool:
+    async def _test_sse_connection(self, config: ServerConfig) -> bool:
         """
         Test SSE server connection
         
         Args:
-            server_config: SSE server configuration with url and headers
+            config: SSE server configuration with url and headers
             
         Returns:
             bool: True if SSE server is reachable
         """
+        if not self._http_backend_available():
+            return False
+        
         try:
-            import aiohttp
-            
-            url = server_config.get('url', '')
-            headers = server_config.get('headers', {})
-            timeout = server_config.get('timeout', 10)
+            url, headers, timeout = config.url, config.headers, config.timeout
             
             if not url:
                 logger.warning("❌ No URL specified for SSE server")
                 return False
             
-            logger.info(f"🔍 Testing SSE connection to: {url}")
+            logger.info("🔍 Testing SSE connection to: %s", url)
             
             # SSE 서버는 Server-Sent Events를 사용하므로 
             # 먼저 간단한 GET 요청으로 서버가 응답하는지 확인
-            async with aiohttp.ClientSession() as session:
-                try:
-                    # SSE endpoint는 보통 GET으로 스트림을 열기 때문에 GET 요청 시도
-                    async with session.get(
-                        url,
-                        headers={**headers, 'Accept': 'text/event-stream'},
-                        timeout=aiohttp.ClientTimeout(total=timeout)
-                    ) as response:
-                        # SSE 서버는 보통 200 OK로 응답하고 스트림을 열어둠
-                        if response.status in [200, 204]:
-                            logger.info(f"✅ SSE connection test successful: {url} (HTTP {response.status})")
-                            return True
-                        # 405 Method Not Allowed는 서버가 존재하지만 GET을 지원하지 않는 경우
-                        elif response.status == 405:
-                            logger.info(f"⚠️ SSE server exists but doesn't support GET: {url}")
-                            # POST로 재시도
-                            return await self._test_sse_connection_with_post(server_config)
-                        else:
-                            logger.warning(f"❌ SSE connection test failed: HTTP {response.status}")
-                            return False
-                            
-                except asyncio.TimeoutError:
-                    logger.warning(f"⏰ SSE connection test timed out: {url}")
-                    return False
-                except aiohttp.ClientError as e:
-                    logger.warning(f"❌ SSE connection test failed: {e}")
-                    return False
+            try:
+                # SSE endpoint는 보통 GET으로 스트림을 열기 때문에 GET 요청 시도
+                status = await self._probe_sse_get(
+                    url, {**headers, 'Accept': 'text/event-stream'}, timeout
+                )
+            except _HTTP_TIMEOUT_ERRORS:
+                logger.warning("⏰ SSE connection test timed out: %s", url)
+                return False
+            except _HTTP_CLIENT_ERRORS as e:
+                logger.warning("❌ SSE connection test failed: %s", e)
+                return False
+            
+            # SSE 서버는 보통 200 OK로 응답하고 스트림을 열어둠
+            if status in [200, 204]:
+                logger.info("✅ SSE connection test successful: %s (HTTP %s)", url, status)
+                return True
+            # 405 Method Not Allowed는 서버가 존재하지만 GET을 지원하지 않는 경우
+            elif status == 405:
+                logger.info("⚠️ SSE server exists but doesn't support GET: %s", url)
+                # POST로 재시도
+                return await self._test_sse_connection_with_post(config)
+            else:
+                logger.warning("❌ SSE connection test failed: HTTP %s", status)
+                return False
                     
-        except ImportError:
-            logger.error("aiohttp is required for SSE connections. Install with: pip install aiohttp")
-            return False
         except Exception as e:
-            logger.error(f"SSE connection test failed: {e}")
+            logger.error("SSE connection test failed: %s", e)
             return False
     
-    async def _test_sse_connection_with_post(self, server_config: Dict) -> bool:
+    async def _test_sse_connection_with_post(self, config: ServerConfig) -> bool:
         """
         Test SSE server connection with POST (for servers that don't support GET)
         """
+        if not self._http_backend_available():
+            return False
+        
         try:
-            import aiohttp
+            url, headers, timeout = config.url, config.headers, config.timeout
             
-            url = server_config.get('url', '')
-            headers = server_config.get('headers', {})
-            timeout = server_config.get('timeout', 10)
-            
-            logger.info(f"🔍 Testing SSE connection with POST to: {url}")
+            logger.info("🔍 Testing SSE connection with POST to: %s", url)
             
             # MCP 초기화 메시지
             init_message = {
@@ -329,35 +514,110 @@ class McpConnectionManager(IMcpConnectionManager):
                 }
             }
             
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.post(
-                        url, 
-                        json=init_message,
-                        headers={**headers, 'Content-Type': 'application/json'},
-                        timeout=aiohttp.ClientTimeout(total=timeout)
-                    ) as response:
-                        if response.status in [200, 202, 204]:
-                            logger.info(f"✅ SSE POST connection test successful: {url}")
-                            return True
-                        else:
-                            logger.warning(f"❌ SSE POST connection test failed: HTTP {response.status}")
-                            return False
-                            
-                except asyncio.TimeoutError:
-                    logger.warning(f"⏰ SSE POST connection test timed out: {url}")
-                    return False
-                except aiohttp.ClientError as e:
-                    logger.warning(f"❌ SSE POST connection test failed: {e}")
-                    return False
+            try:
+                status = await self._probe_sse_post(
+                    url, init_message, {**headers, 'Content-Type': 'application/json'}, timeout
+                )
+            except _HTTP_TIMEOUT_ERRORS:
+                logger.warning("⏰ SSE POST connection test timed out: %s", url)
+                return False
+            except _HTTP_CLIENT_ERRORS as e:
+                logger.warning("❌ SSE POST connection test failed: %s", e)
+                return False
+            
+            if status in [200, 202, 204]:
+                logger.info("✅ SSE POST connection test successful: %s", url)
+                return True
+            else:
+                logger.warning("❌ SSE POST connection test failed: HTTP %s", status)
+                return False
                     
-        except ImportError:
-            logger.error("aiohttp is required for SSE connections. Install with: pip install aiohttp")
-            return False
         except Exception as e:
-            logger.error(f"SSE connection test failed: {e}")
+            logger.error("SSE connection test failed: %s", e)
             return False
     
+    def _http_backend_available(self) -> bool:
+        """Check that the configured HTTP client library is installed"""
+        if self.http_backend == 'httpx':
+            if httpx is None:
+                logger.error("httpx is required for the httpx SSE backend. Install with: pip install httpx")
+                return False
+        elif aiohttp is None:
+            logger.error("aiohttp is required for SSE connections. Install with: pip install aiohttp")
+            return False
+        return True
+    
+    async def _get_session(self) -> Any:
+        """Return the shared keep-alive HTTP client for SSE requests, creating it on first use"""
+        if self._http_session is None:
+            if self.http_backend == 'httpx':
+                limits = httpx.Limits(max_keepalive_connections=64, keepalive_expiry=30)
+                try:
+                    # HTTP/2 multiplexes concurrent requests to one origin over a single connection
+                    self._http_session = httpx.AsyncClient(http2=True, limits=limits)
+                except ImportError:
+                    # h2 패키지가 없으면 HTTP/1.1 keep-alive로 동작
+                    self._http_session = httpx.AsyncClient(limits=limits)
+            else:
+                self._http_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30)
+                )
+        return self._http_session
+    
+    async def _close_session(self) -> None:
+        """Close the shared HTTP client"""
+        session, self._http_session = self._http_session, None
+        if session is None:
+            return
+        if self.http_backend == 'httpx':
+            await session.aclose()
+        else:
+            await session.close()
+    
+    async def _probe_sse_get(self, url: str, headers: Mapping[str, str], timeout: float) -> int:
+        """Open the SSE stream, peek at the first chunk and return the HTTP status"""
+        session = await self._get_session()
+        
+        if self.http_backend == 'httpx':
+            async with session.stream('GET', url, headers=headers, timeout=timeout) as response:
+                if response.status_code in [200, 204]:
+                    await self._peek_sse_chunk(response.aiter_raw().__anext__())
+                return response.status_code
+        
+        async with session.get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if response.status in [200, 204]:
+                try:
+                    await self._peek_sse_chunk(response.content.readany())
+                finally:
+                    # 스트림을 즉시 해제해 커넥션을 풀로 반환
+                    response.release()
+            return response.status
+    
+    async def _probe_sse_post(self, url: str, payload: Dict, headers: Mapping[str, str], timeout: float) -> int:
+        """POST an initialize request and return the HTTP status without reading the body"""
+        session = await self._get_session()
+        
+        if self.http_backend == 'httpx':
+            async with session.stream('POST', url, json=payload, headers=headers, timeout=timeout) as response:
+                return response.status_code
+        
+        async with session.post(
+            url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            return response.status
+    
+    @staticmethod
+    async def _peek_sse_chunk(read_chunk) -> None:
+        """Wait briefly for the first stream chunk to confirm SSE framing"""
+        try:
+            first_chunk = await asyncio.wait_for(read_chunk, timeout=1.0)
+        except (asyncio.TimeoutError, StopAsyncIteration):
+            return
+        if first_chunk and b':' not in first_chunk[:256]:
+            logger.debug("⚠️ SSE endpoint returned non-SSE framing: %r", first_chunk[:100])
+    
     async def is_connection_alive(self, connection: McpConnection) -> bool:
         """
         Check if existing connection is still alive
@@ -374,39 +634,38 @@ class McpConnectionManager(IMcpConnectionManager):
                 
             # Check if process is still running
             if not await connection.is_alive():
-                logger.debug(f"💀 Connection process for {connection.server_id} is dead")
+                logger.debug("💀 Connection process for %s is dead", connection.server_id)
                 return False
             
             # Could add additional health checks here (ping/heartbeat)
             # For now, just check process status
             connection.touch()
+            if self.active_connections.get(connection.server_id) is connection:
+                self.active_connections.move_to_end(connection.server_id)
             return True
             
         except Exception as e:
-            logger.error(f"Error checking connection health for {connection.server_id}: {e}")
+            logger.error("Error checking connection health for %s: %s", connection.server_id, e)
             return False
     
     async def _create_new_connection(self, server_config: Dict) -> McpConnection:
         """Create a new MCP server connection"""
-        transport_type = server_config.get('transport_type', 'stdio')
-        server_id = server_config.get('id', 'unknown')
+        config = ServerConfig.from_dict(server_config)
+        server_id = config.id
         
         # SSE 서버 연결
-        if transport_type == 'sse':
-            url = server_config.get('url', '')
-            if not url:
+        if config.transport_type == 'sse':
+            if not config.url:
                 raise ValueError("No URL specified for SSE server")
             
             # SSE 연결은 process가 없으므로 None으로 설정
             # 실제 SSE 연결은 요청 시점에 생성됨
-            connection = McpConnection(server_id, server_config, None)
-            logger.info(f"✅ Created SSE connection configuration for server {server_id}")
+            connection = McpConnection(server_id, server_config, None, config)
+            logger.info("✅ Created SSE connection configuration for server %s", server_id)
             return connection
         
         # stdio 서버 연결 (기존 로직)
-        command = server_config.get('command', '')
-        args = server_config.get('args', [])
-        env = server_config.get('env', {})
+        command, args, env = config.command, config.args, config.env
         
         if not command:
             raise ValueError("No command specified for stdio server")
@@ -421,13 +680,15 @@ class McpConnectionManager(IMcpConnectionManager):
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
-            env=full_env
+            env=full_env,
+            close_fds=False
         )
         
         # Create connection object
-        connection = McpConnection(server_id, server_config, process)
+        connection = McpConnection(server_id, server_config, process, config)
+        connection.exit_watcher = asyncio.create_task(self._watch_exit(connection))
         
-        logger.info(f"✅ Created new connection for server {server_id}")
+        logger.info("✅ Created new connection for server %s", server_id)
         return connection
     
     async def _cleanup_connection(self, server_id: str) -> None:
@@ -436,13 +697,89 @@ class McpConnectionManager(IMcpConnectionManager):
             connection = self.active_connections[server_id]
             await self.disconnect(connection)
     
+    def _evict_over_capacity(self) -> None:
+        """
+        Evict least recently used connections beyond max_connections
+        
+        Connections with requests in flight or a connect() in progress are
+        skipped; if every connection is busy the pool stays over the cap.
+        """
+        excess = len(self.active_connections) - self.max_connections
+        if excess <= 0:
+            return
+        
+        victims = []
+        for server_id, connection in self.active_connections.items():
+            if len(victims) == excess:
+                break
+            if self._is_busy(connection):
+                continue
+            victims.append(connection)
+        
+        for connection in victims:
+            logger.info("♻️ Evicting least recently used connection for server %s", connection.server_id)
+            del self.active_connections[connection.server_id]
+            task = asyncio.create_task(self.disconnect(connection))
+            self._eviction_tasks.add(task)
+            task.add_done_callback(self._on_eviction_done)
+        
+        if len(victims) < excess:
+            logger.warning("⚠️ Connection pool over capacity (%d > %d): remaining connections are busy",
+                           len(self.active_connections), self.max_connections)
+    
+    def _is_busy(self, connection: McpConnection) -> bool:
+        """True while requests are in flight or a connect() for the server is in progress"""
+        return connection.in_flight > 0 or connection.server_id in self._connect_lock_refs
+    
+    def _on_eviction_done(self, task: asyncio.Task) -> None:
+        """Drop the finished eviction task and surface any error it raised"""
+        self._eviction_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Error evicting connection: %s", task.exception())
+    
+    def _ensure_sweeper(self) -> None:
+        """Start the idle connection sweeper if it is not already running"""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._idle_sweep())
+    
+    async def _idle_sweep(self) -> None:
+        """Periodically disconnect connections idle longer than idle_timeout (busy ones are skipped)"""
+        while True:
+            await asyncio.sleep(self.IDLE_SWEEP_INTERVAL)
+            try:
+                now = time.monotonic()
+                idle_connections = [
+                    connection for connection in self.active_connections.values()
+                    if now - connection.last_used_at > self.idle_timeout
+                    and not self._is_busy(connection)
+                ]
+                for connection in idle_connections:
+                    logger.info("💤 Disconnecting idle connection for server %s", connection.server_id)
+                    await self.disconnect(connection)
+            except Exception as e:
+                logger.error("Error during idle connection sweep: %s", e)
+    
     async def cleanup_all_connections(self) -> None:
         """Clean up all active connections (for shutdown)"""
         logger.info("🧹 Cleaning up all MCP connections")
         
-        connections_to_cleanup = list(self.active_connections.values())
-        for connection in connections_to_cleanup:
-            await self.disconnect(connection)
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        
+        for connection in self.active_connections.values():
+            if connection.exit_watcher is not None:
+                connection.exit_watcher.cancel()
+                connection.exit_watcher = None
+        
+        # Swap the pool out in one step so connect() calls racing with shutdown
+        # land in a fresh dict instead of the one being torn down
+        connections_to_cleanup, self.active_connections = self.active_connections, OrderedDict()
+        
+        # Shield the shutdown so a cancelled caller cannot leak subprocesses
+        await asyncio.shield(self._shutdown_processes(list(connections_to_cleanup.values())))
+        if self._eviction_tasks:
+            await asyncio.gather(*self._eviction_tasks, return_exceptions=True)
         
-        self.active_connections.clear()
+        await self._close_session()
         logger.info("✅ All MCP connections cleaned up")
\ No newline at end of file
@@ -86,6 +86,8 @@ class McpToolExecutor(IMcpToolExecutor):
         """
         start_time = time.time()
         execution_id = f"{server_id}_{tool_name}_{int(start_time)}"
+        # Keep the connection out of LRU eviction while the call is in flight
+        connection.in_flight += 1
         
         try:
             logger.info(f"🔧 Executing tool {tool_name} on server {server_id}")
@@ -201,6 +203,10 @@ class McpToolExecutor(IMcpToolExecutor):
                 "UNEXPECTED_ERROR",
                 {"exception": str(e), "tool": tool_name, "arguments": arguments}
             )
+        finally:
+            connection.in_flight -= 1
+            # Count the end of the call as use so long calls don't look idle right after
+            connection.touch()
     
     async def get_available_tools(self, connection: McpConnection) -> List[Dict]:
         """
@@ -212,6 +218,7 @@ class McpToolExecutor(IMcpToolExecutor):
         Returns:
             List[Dict]: List of available tools with their schemas
         """
+        connection.in_flight += 1
         try:
             logger.debug(f"🔍 Getting available tools from server {connection.server_id}")
             
@@ -264,6 +271,9 @@ class McpToolExecutor(IMcpToolExecutor):
         except Exception as e:
             logger.error(f"Error getting tools from server {connection.server_id}: {e}")
             return []
+        finally:
+            connection.in_flight -= 1
+            connection.touch()
     
     def validate_tool_arguments(self, tool_schema: Dict, arguments: Dict) -> bool:
         """
@@ -456,6 +466,7 @@ class McpToolExecutor(IMcpToolExecutor):
         start_time = time.time()
         execution_id = f"{server_id}_{tool_name}_{int(start_time)}"
         total_output = ""
+        connection.in_flight += 1
         
         try:
             logger.info(f"🌊 Executing streaming tool {tool_name} on server {server_id}")
@@ -531,6 +542,9 @@ class McpToolExecutor(IMcpToolExecutor):
             # Yield error as final chunk for Streamable HTTP
             yield f"\n\n[ERROR] Tool execution failed: {error_message}"
             raise ToolExecutionError(error_message, "STREAMING_EXECUTION_ERROR")
+        finally:
+            connection.in_flight -= 1
+            connection.touch()
     
     async def _read_streaming_response(
         self,
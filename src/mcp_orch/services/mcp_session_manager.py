@@ -4,11 +4,17 @@ MCP Python SDK의 ClientSession 패턴을 따른 지속적 세션 관리
 """
 
 import asyncio
-import json
+import heapq
+import itertools
 import logging
+import os
+import re
 import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any, Union, Tuple
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from uuid import UUID
 from dataclasses import dataclass, field
 from sqlalchemy.orm import Session
@@ -16,10 +22,62 @@ from sqlalchemy.orm import Session
 from ..models import McpServer, ToolCallLog, CallStatus, ClientSession, ServerLog, LogLevel, LogCategory
 from ..models.mcp_server import McpServerStatus
 from ..config import MCPSessionConfig
+from ..utils import json_codec
 from .server_status_service import ServerStatusService
+from .tool_filtering_service import ToolFilteringService
 
 logger = logging.getLogger(__name__)
 
+# stdio 서버 stdout 읽기 청크 크기
+STDIO_READ_CHUNK_SIZE = 64 * 1024
+
+# 정리 작업의 stdio 세션 ping 응답 대기 시간 (초)
+SESSION_PING_TIMEOUT_SECONDS = 5
+
+# 세션별 서버 알림 보관 개수 (초과 시 가장 오래된 알림부터 버림)
+NOTIFICATION_QUEUE_SIZE = 100
+
+# tools/list 요청 공통 필드 - 호출 시 id만 덧붙임 (직렬화 전용, 수정 금지)
+_TOOLS_LIST_TEMPLATE = MappingProxyType({"jsonrpc": "2.0", "method": "tools/list", "params": {}})
+
+# 재시도 가능한 오류 분류 - 그룹 순서가 우선순위 (예: "connection timeout"은 timeout)
+# 각 분기를 문자열 시작에 고정된 lookahead로 감싸서 먼저 나온 키워드가 아닌 먼저 선언된 분류가 선택됨
+_ERROR_CLASSIFIER = re.compile(
+    r"""(?:
+        (?=.*?(?P<initialization>initialization|initialize|not\ initialized))
+      | (?=.*?(?P<parameters>invalid\ request\ parameters|invalid\ parameters|parameter\ error|bad\ request))
+      | (?=.*?(?P<timeout>timeout|timed\ out))
+      | (?=.*?(?P<connection>connection|connect|no\ response))
+    )""",
+    re.IGNORECASE | re.DOTALL | re.VERBOSE,
+)
+
+# 세션 초기화 재시도 대기 시간 (초) - attempt 인덱스로 조회, 첫 시도는 대기 없음
+_INIT_BACKOFF = (0, 1, 2)
+
+# 오류 타입별 도구 호출 재시도 대기 시간 (초)
+_DEFAULT_DELAYS = (1, 2, 4)
+_DELAY_MAPS = MappingProxyType({
+    'initialization': (2, 4, 8),     # 초기화 오류: 긴 대기
+    'parameters': (0.5, 1, 2),       # 파라미터 오류: 짧은 대기
+    'timeout': (1, 3, 5),            # 타임아웃 오류: 중간 대기
+    'connection': _DEFAULT_DELAYS,   # 연결 오류: 기본 대기
+})
+
+# 도구 호출 로그 백그라운드 기록 설정 (큐가 가득 차면 로그를 버리고 경고)
+TOOL_CALL_LOG_QUEUE_SIZE = 10_000
+TOOL_CALL_LOG_BATCH_SIZE = 200
+TOOL_CALL_LOG_FLUSH_INTERVAL = 0.1  # 배치를 모으는 최대 대기 시간 (초)
+
+# server_id 형식: "UUID", "UUID_server_name", "project_id.server_id", "project_id.server_name"
+_UUID_PATTERN = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+_UUID_RE = re.compile(_UUID_PATTERN + r"\Z")
+_SERVER_ID_RE = re.compile(r"(?P<uuid>" + _UUID_PATTERN + r")(?:(?P<sep>[._])(?P<rest>.+))?\Z", re.DOTALL)
+
+# "project_id.server_name" → server UUID 조회 결과 캐시 설정
+RESOLVE_CACHE_TTL_SECONDS = 300
+RESOLVE_CACHE_MAX_ENTRIES = 1024
+
 
 @dataclass
 class McpSession:
@@ -30,12 +88,41 @@ class McpSession:
     write_stream: asyncio.StreamWriter
     session_id: str
     created_at: datetime
-    last_used_at: datetime
-    tools_cache: Optional[List[Dict]] = None
+    tools_cache: Optional[List[Dict]] = None  # 서버가 반환한 (필터링 전) 도구 목록
+    filtered_tools_cache: Optional[List[Dict]] = None  # tools_cache에 툴 설정을 적용한 결과
+    tools_cache_prefs_version: Optional[int] = None  # filtered_tools_cache를 만든 툴 설정 버전
     is_initialized: bool = False
     initialization_lock: Optional[asyncio.Lock] = None
-    _read_buffer: str = ""  # MCP 메시지 읽기용 버퍼
-    _message_queue: List[Dict] = field(default_factory=list)  # 순서가 맞지 않는 메시지 임시 저장용
+    generation: int = 0  # 세션 세대 번호 - 만료 힙의 오래된 항목 판별용
+    reader_task: Optional[asyncio.Task] = None  # stdout 단일 리더 (응답 분배) 태스크
+    sse_server: Optional[Any] = None  # SSE 세션의 연결된 SSEMCPServer (stdio는 None)
+    in_use: int = 0  # 세션을 받아 아직 사용 중인 호출 수 (0보다 크면 LRU 제거 대상에서 제외)
+    _read_buffer: bytearray = field(default_factory=bytearray)  # 아직 줄바꿈이 오지 않은 수신 바이트
+    _pending: Dict[int, asyncio.Future] = field(default_factory=dict)  # 메시지 ID별 응답 대기 Future
+    _notifications: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+    )  # 서버가 먼저 보낸 알림/요청
+    # TTL 계산용 단조 시계 (벽시계 변경에 영향받지 않음)
+    created_monotonic: float = field(default_factory=time.monotonic)
+    last_used_monotonic: float = field(default_factory=time.monotonic)
+    # server_id("project_id.server_name")에서 미리 분리한 값 - 상태 업데이트용
+    project_uuid: Optional[UUID] = field(init=False, default=None)
+    server_name: str = field(init=False, default="")
+    
+    def __post_init__(self):
+        self.server_name = self.server_id
+        if '.' in self.server_id:
+            project_id_str, server_name = self.server_id.split('.', 1)
+            try:
+                self.project_uuid = UUID(project_id_str)
+                self.server_name = server_name
+            except ValueError:
+                pass
+    
+    @property
+    def last_used_at(self) -> datetime:
+        """마지막 사용 시각 (로그/표시용 벽시계 값)"""
+        return self.created_at + timedelta(seconds=self.last_used_monotonic - self.created_monotonic)
 
 
 class ToolExecutionError(Exception):
@@ -64,27 +151,49 @@ class McpSessionManager:
         """
         if config is None:
             # Load configuration with environment variable support
-            import os
             config = MCPSessionConfig(
                 session_timeout_minutes=int(os.getenv('MCP_SESSION_TIMEOUT_MINUTES', '30')),
-                cleanup_interval_minutes=int(os.getenv('MCP_SESSION_CLEANUP_INTERVAL_MINUTES', '5'))
+                cleanup_interval_minutes=int(os.getenv('MCP_SESSION_CLEANUP_INTERVAL_MINUTES', '5')),
+                max_sessions=int(os.getenv('MCP_SESSION_MAX_SESSIONS', '128'))
             )
             
         self.config = config
-        self.sessions: Dict[str, McpSession] = {}
+        # 최근 사용 순서 유지 (가장 오래 사용하지 않은 세션이 맨 앞) - max_sessions 초과 시 LRU 제거
+        self.sessions: "OrderedDict[str, McpSession]" = OrderedDict()
         self.session_timeout = timedelta(minutes=config.session_timeout_minutes)
         self.cleanup_interval = timedelta(minutes=config.cleanup_interval_minutes)
+        # 만료 힙/정리 루프는 단조 시계 초 단위로 계산
+        self.session_timeout_seconds = self.session_timeout.total_seconds()
+        self.cleanup_interval_seconds = self.cleanup_interval.total_seconds()
         self._cleanup_task: Optional[asyncio.Task] = None
-        self._message_id_counter = 0
+        # JSON-RPC 메시지 ID 생성기 - C 구현 count.__next__를 직접 바인딩 (래퍼 프레임 없음)
+        self._get_next_message_id = itertools.count(1).__next__
+        # ToolCallLog 행 대기열 - 백그라운드 작성기가 배치로 저장
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=TOOL_CALL_LOG_QUEUE_SIZE)
+        self._log_writer: Optional[asyncio.Task] = None
+        # 서브프로세스 기본 환경 변수 스냅샷 - start_manager()에서 갱신
+        self._base_env: Dict[str, str] = dict(os.environ)
+        # (만료 시각, server_id, 세션 세대) 최소 힙 - 세션당 항목 하나, 지연 삭제
+        self._expiry_heap: List[Tuple[float, str, int]] = []
+        self._session_generation = itertools.count(1)
+        # server_id → (캐시 시각, (project_id, actual_server_id)) - DB 조회가 필요한 이름 기반 ID만 캐시
+        self._resolve_cache: "OrderedDict[str, Tuple[float, Tuple[Optional[UUID], Optional[UUID]]]]" = OrderedDict()
+        # 서버별 세션 생성/정리 임계 구역 락 (RPC 자체는 락 밖에서 병렬 수행)
+        self._server_locks: Dict[str, asyncio.Lock] = {}
+        # server_id → 락을 보유 중이거나 대기 중인 작업 수 - 0이 되면 락 제거 (종료된 서버 ID의 락 누적 방지)
+        self._server_lock_refs: Dict[str, int] = {}
         
         logger.info(f"🔧 MCP Session Manager initialized:")
         logger.info(f"   Session timeout: {config.session_timeout_minutes} minutes")
         logger.info(f"   Cleanup interval: {config.cleanup_interval_minutes} minutes")
+        logger.info(f"   Max sessions: {config.max_sessions}")
         
     async def start_manager(self):
         """세션 매니저 시작 - 정리 작업 스케줄링"""
         if self._cleanup_task is None:
+            self._base_env = dict(os.environ)
             self._cleanup_task = asyncio.create_task(self._cleanup_expired_sessions())
+            self._log_writer = asyncio.create_task(self._drain_tool_call_logs())
             logger.info("🟢 MCP Session Manager started")
     
     async def stop_manager(self):
@@ -97,18 +206,24 @@ class McpSessionManager:
                 pass
             self._cleanup_task = None
             
-        # 모든 활성 세션 종료
-        for session in list(self.sessions.values()):
-            await self._close_session(session)
+        # 모든 활성 세션 동시 종료
+        sessions = list(self.sessions.values())
         self.sessions.clear()
+        await asyncio.gather(*(self._close_session(session) for session in sessions), return_exceptions=True)
+        self._expiry_heap.clear()
+        
+        # 남은 도구 호출 로그 저장 후 작성기 종료
+        if self._log_writer:
+            self._log_writer.cancel()
+            try:
+                await self._log_writer
+            except asyncio.CancelledError:
+                pass
+            self._log_writer = None
+        await self._flush_tool_call_logs()
         logger.info("🔴 MCP Session Manager stopped")
     
-    def _get_next_message_id(self) -> int:
-        """다음 메시지 ID 생성"""
-        self._message_id_counter += 1
-        return self._message_id_counter
-    
-    def _resolve_server_id(self, server_id: str) -> Tuple[Optional[UUID], Optional[UUID]]:
+    async def _resolve_server_id(self, server_id: str) -> Tuple[Optional[UUID], Optional[UUID]]:
         """
         server_id를 해석해서 (project_id, actual_server_id) 튜플 반환
         
@@ -118,53 +233,93 @@ class McpSessionManager:
         Returns:
             tuple: (project_id, actual_server_id) - 둘 다 UUID 또는 None
         """
-        if '.' in server_id:
-            try:
-                project_id_str, server_id_or_name = server_id.split('.', 1)
-                project_id = UUID(project_id_str)
-                
-                # server_id_or_name이 UUID인지 확인
-                try:
-                    # UUID 형식이면 그대로 사용
-                    actual_server_id = UUID(server_id_or_name)
-                    logger.debug(f"Resolved server_id {server_id} to project={project_id}, server={actual_server_id}")
-                    return project_id, actual_server_id
-                except ValueError:
-                    # UUID가 아니면 서버 이름으로 간주하고 DB 조회
-                    from ..database import get_db
-                    from ..models import McpServer
-                    db = next(get_db())
-                    try:
-                        server = db.query(McpServer).filter(
-                            McpServer.project_id == project_id,
-                            McpServer.name == server_id_or_name
-                        ).first()
-                        if server:
-                            logger.debug(f"Resolved server_id {server_id} to project={project_id}, server={server.id}")
-                            return project_id, server.id
-                        else:
-                            logger.warning(f"Server not found for {server_id}")
-                            return project_id, None
-                    finally:
-                        db.close()
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Failed to parse server_id format {server_id}: {e}")
-                return None, None
+        match = _SERVER_ID_RE.match(server_id)
+        if match is None:
+            logger.error(f"Cannot convert server_id {server_id} to UUID: unrecognized server_id format")
+            return None, None
+        
+        uuid_part, separator, rest = match.group('uuid', 'sep', 'rest')
+        
+        # UUID 또는 UUID_server_name 형식: 앞의 UUID가 서버 ID
+        if separator != '.':
+            if separator == '_':
+                logger.debug("Extracted UUID %s from server_id %s", uuid_part, server_id)
+            return None, UUID(uuid_part)
+        
+        # "project_id.server_id" 또는 "project_id.server_name" 형식
+        project_id = UUID(uuid_part)
+        if _UUID_RE.match(rest):
+            # UUID 형식이면 그대로 사용
+            actual_server_id = UUID(rest)
+            logger.debug("Resolved server_id %s to project=%s, server=%s", server_id, project_id, actual_server_id)
+            return project_id, actual_server_id
+        
+        # UUID가 아니면 서버 이름으로 간주 - 캐시 확인 후 DB 조회
+        cached = self._resolve_cache.get(server_id)
+        if cached is not None:
+            cached_at, resolved = cached
+            if time.monotonic() - cached_at < RESOLVE_CACHE_TTL_SECONDS:
+                self._resolve_cache.move_to_end(server_id)
+                return resolved
+            del self._resolve_cache[server_id]
+        
+        # 동기 DB 조회는 워커 스레드에서 실행하여 이벤트 루프 차단 방지
+        actual_server_id = await asyncio.to_thread(self._query_server_id_by_name, project_id, rest)
+        if actual_server_id:
+            logger.debug("Resolved server_id %s to project=%s, server=%s", server_id, project_id, actual_server_id)
+            self._cache_resolved_server_id(server_id, (project_id, actual_server_id))
+            return project_id, actual_server_id
         else:
-            # UUID 또는 UUID_server_name 형식 처리
-            try:
-                # '_'가 포함된 경우 UUID 부분만 추출
-                if '_' in server_id:
-                    uuid_part = server_id.split('_')[0]
-                    actual_server_id = UUID(uuid_part)
-                    logger.debug(f"Extracted UUID {uuid_part} from server_id {server_id}")
-                else:
-                    # 순수 UUID 형식
-                    actual_server_id = UUID(server_id)
-                return None, actual_server_id
-            except (ValueError, TypeError) as e:
-                logger.error(f"Cannot convert server_id {server_id} to UUID: {e}")
-                return None, None
+            logger.warning(f"Server not found for {server_id}")
+            return project_id, None
+    
+    @staticmethod
+    def _query_server_id_by_name(project_id: UUID, server_name: str) -> Optional[UUID]:
+        """프로젝트 내 서버 이름으로 서버 ID 조회 (동기 DB 세션 - 워커 스레드에서 호출)"""
+        from ..database import get_db
+        db = next(get_db())
+        try:
+            server = db.query(McpServer.id).filter(
+                McpServer.project_id == project_id,
+                McpServer.name == server_name
+            ).first()
+            return server.id if server else None
+        finally:
+            db.close()
+    
+    def _cache_resolved_server_id(self, server_id: str, resolved: Tuple[Optional[UUID], Optional[UUID]]) -> None:
+        """이름 기반 server_id 해석 결과 캐시 (LRU + TTL)"""
+        self._resolve_cache[server_id] = (time.monotonic(), resolved)
+        self._resolve_cache.move_to_end(server_id)
+        while len(self._resolve_cache) > RESOLVE_CACHE_MAX_ENTRIES:
+            self._resolve_cache.popitem(last=False)
+    
+    async def close_session(self, server_id: str) -> None:
+        """특정 서버의 세션 종료 및 관련 캐시 무효화"""
+        self._resolve_cache.pop(server_id, None)
+        async with self._server_lock(server_id):
+            session = self.sessions.pop(server_id, None)
+            if session:
+                await self._close_session(session)
+    
+    @asynccontextmanager
+    async def _server_lock(self, server_id: str):
+        """서버별 락 보유 구간 - 보유/대기 작업 수를 세어 마지막 작업이 나갈 때 락 제거"""
+        lock = self._server_locks.get(server_id)
+        if lock is None:
+            lock = self._server_locks[server_id] = asyncio.Lock()
+        # acquire 전에 증가시켜야 대기 중인 작업이 있는 락이 제거되지 않음
+        self._server_lock_refs[server_id] = self._server_lock_refs.get(server_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            remaining = self._server_lock_refs[server_id] - 1
+            if remaining:
+                self._server_lock_refs[server_id] = remaining
+            else:
+                del self._server_lock_refs[server_id]
+                del self._server_locks[server_id]
     
     async def get_or_create_session(self, server_id: str, server_config: Dict) -> McpSession:
         """서버 세션을 가져오거나 새로 생성 (MCP 표준 패턴)"""
@@ -172,35 +327,101 @@ class McpSessionManager:
         # server_id가 이미 project_id를 포함하고 있을 수 있음 (예: "project_id.server_id" 형식)
         session_key = server_id
         
-        # 기존 세션이 있고 유효한지 확인
-        if session_key in self.sessions:
-            session = self.sessions[session_key]
+        # 같은 서버에 대한 중복 생성/정리 경합 방지 - 세션 확보까지만 락 유지
+        async with self._server_lock(session_key):
+            # 기존 세션이 있고 유효한지 확인
+            if session_key in self.sessions:
+                session = self.sessions[session_key]
+                
+                # 세션이 살아있는지 확인
+                if await self._is_session_alive(session):
+                    session.last_used_monotonic = time.monotonic()
+                    self.sessions.move_to_end(session_key)
+                    logger.info(f"♻️ Reusing existing session for server {server_id}")
+                    return session
+                else:
+                    # 죽은 세션 정리 (close 대기 중 다른 경로에서 이미 제거했을 수 있음)
+                    logger.warning(f"⚠️ Session for server {server_id} is dead, creating new one")
+                    await self._close_session(session)
+                    self.sessions.pop(session_key, None)
             
-            # 세션이 살아있는지 확인
-            if await self._is_session_alive(session):
-                session.last_used_at = datetime.utcnow()
-                logger.info(f"♻️ Reusing existing session for server {server_id}")
-                return session
-            else:
-                # 죽은 세션 정리
-                logger.warning(f"⚠️ Session for server {server_id} is dead, creating new one")
-                await self._close_session(session)
-                del self.sessions[session_key]
+            # 세션 수 상한 유지 - 새 프로세스를 띄우기 전에 LRU 세션 정리
+            await self._evict_lru_sessions()
+            
+            # 새 세션 생성 (MCP stdio_client 패턴)
+            session = await self._create_new_session(server_id, server_config)
+            self.sessions[session_key] = session
+            self._schedule_expiry(session_key, session)
+            logger.info(f"🆕 Created new session for server {server_id}")
+            return session
+    
+    @asynccontextmanager
+    async def _use_session(self, server_id: str, server_config: Dict):
+        """세션을 가져와 호출이 끝날 때까지 사용 중으로 표시 (LRU 제거 방지)"""
+        session = await self.get_or_create_session(server_id, server_config)
+        # get_or_create_session 반환과 증가 사이에는 await가 없으므로 다른 작업이 끼어들 수 없음
+        session.in_use += 1
+        try:
+            yield session
+        finally:
+            session.in_use -= 1
+    
+    async def _evict_lru_sessions(self) -> None:
+        """
+        세션 수가 max_sessions에 도달했으면 가장 오래 사용하지 않은 세션부터 종료
         
-        # 새 세션 생성 (MCP stdio_client 패턴)
-        session = await self._create_new_session(server_id, server_config)
-        self.sessions[session_key] = session
-        logger.info(f"🆕 Created new session for server {server_id}")
-        return session
+        사용 중인 세션(in_use)과 다른 작업이 서버 락을 보유/대기 중인 세션은 건너뛰며,
+        모든 세션이 사용 중이면 요청이 끝날 때까지 일시적으로 상한 초과를 허용.
+        락을 기다리지 않는 세션만 고르므로 호출자의 서버 락과 교착되지 않음.
+        """
+        while self.sessions and len(self.sessions) >= self.config.max_sessions:
+            victim_key = next(
+                (
+                    key for key, session in self.sessions.items()
+                    if not session.in_use and key not in self._server_lock_refs
+                ),
+                None
+            )
+            if victim_key is None:
+                logger.warning(f"⚠️ Session limit ({self.config.max_sessions}) reached but all sessions are busy, allowing temporary overflow")
+                return
+            victim = self.sessions[victim_key]
+            async with self._server_lock(victim_key):
+                # 락 획득 후 여전히 같은 유휴 세션인지 다시 확인 (_expire_session과 동일한 패턴)
+                if self.sessions.get(victim_key) is not victim or victim.in_use:
+                    continue
+                del self.sessions[victim_key]
+                logger.info(f"♻️ Session limit ({self.config.max_sessions}) reached, closing least recently used session for server {victim_key}")
+                await self._close_session(victim)
+    
+    @staticmethod
+    def _build_sse_config(server_id: str, server_config: Dict) -> "SSEServerConfig":
+        """서버 설정 딕셔너리에서 SSEServerConfig 생성 (세션 생성 시 한 번만 호출)"""
+        from ..core.sse_server import SSEServerConfig
+        
+        return SSEServerConfig(
+            name=server_id,
+            url=server_config.get('url', ''),
+            headers=server_config.get('headers', {}),
+            timeout=server_config.get('timeout', 30),
+            disabled=not server_config.get('is_enabled', True)
+        )
     
     async def _create_new_session(self, server_id: str, server_config: Dict) -> McpSession:
         """새 MCP 세션 생성 - stdio/SSE 패턴 모두 지원"""
         transport_type = server_config.get('transport_type', 'stdio')
         
         if transport_type == 'sse':
-            # SSE 서버는 별도 처리 - 더미 세션 객체 생성
-            logger.info(f"🌐 Creating SSE session placeholder for server {server_id}")
-            # SSE는 process가 없으므로 None으로 설정하고 더미 스트림 사용
+            # SSE 서버는 연결 및 MCP 초기화까지 마친 SSEMCPServer를 세션에 보관하여 재사용
+            from ..core.sse_server import SSEMCPServer
+            
+            sse_config = self._build_sse_config(server_id, server_config)
+            sse_server = SSEMCPServer(sse_config)
+            
+            logger.info(f"🌐 Connecting to SSE server {server_id} at {sse_config.url}")
+            await sse_server.start(skip_initialization=False)
+            
+            # SSE는 process가 없으므로 None으로 설정하고 HTTP 연결은 sse_server가 관리
             session = McpSession(
                 server_id=server_id,
                 process=None,  # SSE는 프로세스가 없음
@@ -208,8 +429,9 @@ class McpSessionManager:
                 write_stream=None,  # SSE는 HTTP 기반
                 session_id=f"sse_{server_id}_{int(time.time())}",
                 created_at=datetime.utcnow(),
-                last_used_at=datetime.utcnow(),
-                is_initialized=True  # SSE는 별도 초기화 불필요
+                is_initialized=True,  # sse_server.start()에서 초기화 완료
+                tools_cache=list(sse_server.tools),  # 연결 시 조회한 도구 목록
+                sse_server=sse_server
             )
             return session
         
@@ -224,10 +446,8 @@ class McpSessionManager:
         logger.info(f"🚀 Creating new MCP session for server {server_id}")
         logger.info(f"🔍 Command: {command} {' '.join(args)}")
         
-        # 환경 변수 설정
-        import os
-        full_env = os.environ.copy()
-        full_env.update(env)
+        # 환경 변수 설정 (기본 환경 스냅샷 + 서버별 환경 변수)
+        full_env = self._base_env | env
         
         # stdio 서브프로세스 생성 (MCP 표준)
         try:
@@ -236,7 +456,8 @@ class McpSessionManager:
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env=full_env
+                env=full_env,
+                close_fds=False
             )
             logger.info(f"✅ MCP process created with PID: {process.pid}")
         except Exception as e:
@@ -255,9 +476,9 @@ class McpSessionManager:
             write_stream=write_stream,
             session_id=f"session_{server_id}_{int(time.time())}",
             created_at=datetime.utcnow(),
-            last_used_at=datetime.utcnow(),
             initialization_lock=asyncio.Lock()
         )
+        session.reader_task = asyncio.create_task(self._demux_loop(session))
         
         return session
     
@@ -279,13 +500,12 @@ class McpSessionManager:
             logger.info(f"🔧 Initializing MCP session for server {session.server_id}")
             
             # 재시도 설정
-            max_retries = 3
-            base_delay = 1  # 초기 대기 시간 (초)
+            max_retries = len(_INIT_BACKOFF)
             
             for attempt in range(max_retries):
                 try:
                     if attempt > 0:
-                        delay = base_delay * (2 ** (attempt - 1))
+                        delay = _INIT_BACKOFF[attempt]
                         logger.info(f"⏳ Retrying initialization (attempt {attempt + 1}/{max_retries}) after {delay}s delay...")
                         await asyncio.sleep(delay)
                     
@@ -308,10 +528,12 @@ class McpSessionManager:
                     }
                     
                     # 초기화 메시지 전송
-                    await self._send_message(session, init_message)
+                    init_future = await self._send_message(session, init_message)
                     
                     # 초기화 응답 대기 (메시지 ID 매칭) - Context7 등 복잡한 서버를 위해 타임아웃 증가
-                    init_response = await self._read_message(session, timeout=30, expected_id=init_message['id'])
+                    init_response = await self._read_message(
+                        session, timeout=30, expected_id=init_message['id'], future=init_future
+                    )
                     if not init_response or init_response.get('id') != init_message['id']:
                         raise Exception("Failed to receive initialization response")
                     
@@ -340,63 +562,25 @@ class McpSessionManager:
             
             # 🔄 서버 상태 자동 업데이트: MCP 세션 초기화 성공 시 ACTIVE로 설정
             try:
-                # server_id에서 프로젝트 ID 추출 (server_id가 "project_id.server_name" 형태인 경우)
-                if '.' in session.server_id:
-                    project_id_str, server_name = session.server_id.split('.', 1)
-                    project_id = UUID(project_id_str)
-                    
+                # server_id가 "project_id.server_name" 형태인 경우에만 (세션 생성 시 분리해 둔 값 사용)
+                if session.project_uuid is not None:
                     await ServerStatusService.update_server_status_on_connection(
                         server_id=session.server_id,
-                        project_id=project_id,
+                        project_id=session.project_uuid,
                         status=McpServerStatus.ACTIVE,
                         connection_type="MCP_SESSION_INIT"
                     )
             except Exception as e:
                 logger.error(f"❌ Failed to update server status on MCP session init: {e}")
     
-    def _should_retry_error(self, error: Exception) -> str:
-        """재시도 가능한 오류인지 확인하고 오류 타입 반환"""
-        error_msg = str(error).lower()
-        
-        # 초기화 관련 오류
-        if any(keyword in error_msg for keyword in [
-            'initialization', 'initialize', 'before initialization', 
-            'not initialized', 'initialization incomplete'
-        ]):
-            return 'initialization'
-        
-        # 파라미터 관련 오류
-        if any(keyword in error_msg for keyword in [
-            'invalid request parameters', 'invalid parameters',
-            'parameter error', 'bad request'
-        ]):
-            return 'parameters'
-        
-        # 타임아웃 관련 오류
-        if any(keyword in error_msg for keyword in [
-            'timeout', 'timed out', 'connection timeout'
-        ]):
-            return 'timeout'
-        
-        # 연결 관련 오류
-        if any(keyword in error_msg for keyword in [
-            'connection', 'connect', 'no response', 'read timeout'
-        ]):
-            return 'connection'
-        
-        return None  # 재시도 불가능한 오류
+    def _should_retry_error(self, error: Exception) -> Optional[str]:
+        """재시도 가능한 오류인지 확인하고 오류 타입 반환 (initialization/parameters/timeout/connection)"""
+        match = _ERROR_CLASSIFIER.match(str(error))
+        return match.lastgroup if match else None  # None: 재시도 불가능한 오류
     
     async def _wait_before_retry(self, error_type: str, attempt: int):
         """오류 타입별 재시도 대기"""
-        delay_maps = {
-            'initialization': [2, 4, 8],     # 초기화 오류: 긴 대기
-            'parameters': [0.5, 1, 2],       # 파라미터 오류: 짧은 대기
-            'timeout': [1, 3, 5],            # 타임아웃 오류: 중간 대기
-            'connection': [1, 2, 4],         # 연결 오류: 기본 대기
-            'default': [1, 2, 4]             # 기본
-        }
-        
-        delays = delay_maps.get(error_type, delay_maps['default'])
+        delays = _DELAY_MAPS.get(error_type, _DEFAULT_DELAYS)
         delay = delays[min(attempt, len(delays) - 1)]
         
         logger.info(f"⏳ Waiting {delay}s before retry (error_type: {error_type}, attempt: {attempt + 1})")
@@ -486,12 +670,14 @@ class McpSessionManager:
             except (ValueError, TypeError) as e:
                 logger.warning(f"Invalid project_id format: {project_id}, error: {e}")
         
-        # server_id 해석: "project_id.server_name" 형식 또는 UUID
-        resolved_project_id, actual_server_id = self._resolve_server_id(server_id)
+        # server_id 해석 (DB 조회 가능) - 호출 로그에만 필요하므로 도구 실행과 병렬로 수행
+        resolve_task = None
+        if db:
+            resolve_task = asyncio.create_task(self._resolve_server_id(server_id))
         
-        # 로그 데이터 준비
+        # 로그 데이터 준비 (server_id는 도구 실행 후 채움)
         log_data = {
-            'server_id': actual_server_id,
+            'server_id': None,
             'project_id': converted_project_id,
             'tool_name': tool_name,
             'arguments': arguments,
@@ -524,6 +710,7 @@ class McpSessionManager:
             
             # 성공 로그 저장
             if db:
+                log_data['server_id'] = await self._await_resolved_server_id(resolve_task, server_id)
                 await self._save_tool_call_log(
                     db, log_data, execution_time, CallStatus.SUCCESS, 
                     {'result': result}
@@ -535,6 +722,7 @@ class McpSessionManager:
         except Exception as e:
             execution_time = (time.time() - start_time) * 1000
             if db:
+                log_data['server_id'] = await self._await_resolved_server_id(resolve_task, server_id)
                 status = CallStatus.TIMEOUT if "timeout" in str(e).lower() else CallStatus.FAILED
                 await self._save_tool_call_log(
                     db, log_data, execution_time, status, 
@@ -542,39 +730,34 @@ class McpSessionManager:
                 )
             logger.error(f"❌ Error calling tool {tool_name} on server {server_id}: {e}")
             raise
+        
+        finally:
+            # 취소 등으로 로그 저장 전에 빠져나간 경우 해석 태스크 정리 - 이미 끝난 태스크의 예외도
+            # 회수하여 "Task exception was never retrieved" 경고 방지
+            if resolve_task is not None:
+                if not resolve_task.done():
+                    resolve_task.cancel()
+                await asyncio.gather(resolve_task, return_exceptions=True)
+    
+    async def _await_resolved_server_id(self, resolve_task: asyncio.Task, server_id: str) -> Optional[UUID]:
+        """병렬로 시작한 server_id 해석 결과 대기 - 실패해도 도구 호출 결과에는 영향 없음"""
+        try:
+            _, actual_server_id = await resolve_task
+            return actual_server_id
+        except Exception as e:
+            logger.warning(f"Failed to resolve server_id {server_id} for tool call log: {e}")
+            return None
     
     async def _call_sse_tool(self, server_id: str, server_config: Dict, tool_name: str, arguments: Dict) -> Dict:
-        """SSE 서버 도구 호출"""
+        """SSE 서버 도구 호출 - 세션 풀의 SSE 연결 재사용"""
         try:
-            # SSEMCPServer 인스턴스 생성 및 사용
-            from ..core.sse_server import SSEMCPServer, SSEServerConfig
-            
-            # SSE 서버 설정 생성
-            sse_config = SSEServerConfig(
-                name=server_id,
-                url=server_config.get('url', ''),
-                headers=server_config.get('headers', {}),
-                timeout=server_config.get('timeout', 30),
-                disabled=not server_config.get('is_enabled', True)
-            )
-            
-            # SSE 서버 인스턴스 생성
-            sse_server = SSEMCPServer(sse_config)
+            # 세션 가져오기 또는 생성 (연결/초기화는 세션 생성 시 한 번만 수행)
+            async with self._use_session(server_id, server_config) as session:
+                result = await session.sse_server.call_tool(tool_name, arguments)
+            session.last_used_monotonic = time.monotonic()
+            logger.info(f"✅ SSE tool call completed: {tool_name}")
+            return result
             
-            try:
-                # SSE 서버 시작 (초기화 포함)
-                await sse_server.start(skip_initialization=False)
-                
-                # 도구 호출
-                result = await sse_server.call_tool(tool_name, arguments)
-                logger.info(f"✅ SSE tool call completed: {tool_name}")
-                return result
-                
-            finally:
-                # SSE 서버 정리
-                if sse_server.is_connected:
-                    await sse_server.stop()
-                    
         except Exception as e:
             logger.error(f"❌ Error calling SSE tool {tool_name}: {e}")
             raise ToolExecutionError(f"SSE tool execution failed: {e}")
@@ -582,65 +765,68 @@ class McpSessionManager:
     async def _call_stdio_tool(self, server_id: str, server_config: Dict, tool_name: str, arguments: Dict) -> Dict:
         """stdio 서버 도구 호출 (기존 로직)"""
         # 세션 가져오기 또는 생성
-        session = await self.get_or_create_session(server_id, server_config)
-        
-        # 세션 초기화 (필요시)
-        await self.initialize_session(session)
-        
-        # 도구 호출 메시지 생성
-        message_id = self._get_next_message_id()
-        tool_message = {
-            "jsonrpc": "2.0",
-            "id": message_id,
-            "method": "tools/call",
-            "params": {
-                "name": tool_name
+        async with self._use_session(server_id, server_config) as session:
+            # 세션 초기화 (필요시)
+            await self.initialize_session(session)
+            
+            # 도구 호출 메시지 생성
+            message_id = self._get_next_message_id()
+            tool_message = {
+                "jsonrpc": "2.0",
+                "id": message_id,
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name
+                }
             }
-        }
-        
-        # arguments가 비어있지 않은 경우에만 추가
-        if arguments:
-            tool_message["params"]["arguments"] = arguments
-        else:
-            # 일부 MCP 서버는 빈 arguments를 기대하므로 명시적으로 추가
-            tool_message["params"]["arguments"] = {}
-        
-        logger.info(f"🔧 Sending tool call message: {json.dumps(tool_message)}")
-        
-        # 메시지 전송
-        await self._send_message(session, tool_message)
-        logger.info(f"📤 Sent tool call message for {tool_name} (ID: {tool_message['id']})")
-        
-        # 응답 대기 (메시지 ID 매칭)
-        timeout = server_config.get('timeout', 60)
-        response = await self._read_message(session, timeout=timeout, expected_id=tool_message['id'])
-        
-        # 응답 디버깅
-        if not response:
-            logger.error(f"❌ No response received for tool call {tool_name} (ID: {tool_message['id']})")
-            raise ToolExecutionError("No response received from MCP server")
-        
-        logger.info(f"📥 Received response for {tool_name}: ID={response.get('id')}, expected={tool_message['id']}")
-        logger.info(f"📥 Full response content: {json.dumps(response)}")
-        
-        if response.get('id') != tool_message['id']:
-            logger.error(f"❌ Message ID mismatch: expected {tool_message['id']}, got {response.get('id')}")
-            raise ToolExecutionError(f"Message ID mismatch: expected {tool_message['id']}, got {response.get('id')}")
-        
-        if 'error' in response:
-            error_msg = response['error'].get('message', 'Unknown error')
-            logger.error(f"❌ Tool call error: {error_msg}")
-            raise ToolExecutionError(f"Tool execution failed: {error_msg}")
-        
-        if 'result' not in response:
-            raise ToolExecutionError("No result in tool call response")
-        
-        result = response['result']
-        
-        # 세션 사용 시간 업데이트
-        session.last_used_at = datetime.utcnow()
-        
-        return result
+            
+            # arguments가 비어있지 않은 경우에만 추가
+            if arguments:
+                tool_message["params"]["arguments"] = arguments
+            else:
+                # 일부 MCP 서버는 빈 arguments를 기대하므로 명시적으로 추가
+                tool_message["params"]["arguments"] = {}
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔧 Sending tool call message: %s", json_codec.dumps(tool_message).decode())
+            
+            # 메시지 전송
+            response_future = await self._send_message(session, tool_message)
+            logger.info(f"📤 Sent tool call message for {tool_name} (ID: {tool_message['id']})")
+            
+            # 응답 대기 (메시지 ID 매칭)
+            timeout = server_config.get('timeout', 60)
+            response = await self._read_message(
+                session, timeout=timeout, expected_id=tool_message['id'], future=response_future
+            )
+            
+            # 응답 디버깅
+            if not response:
+                logger.error(f"❌ No response received for tool call {tool_name} (ID: {tool_message['id']})")
+                raise ToolExecutionError("No response received from MCP server")
+            
+            logger.info(f"📥 Received response for {tool_name}: ID={response.get('id')}, expected={tool_message['id']}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📥 Full response content: %s", json_codec.dumps(response).decode())
+            
+            if response.get('id') != tool_message['id']:
+                logger.error(f"❌ Message ID mismatch: expected {tool_message['id']}, got {response.get('id')}")
+                raise ToolExecutionError(f"Message ID mismatch: expected {tool_message['id']}, got {response.get('id')}")
+            
+            if 'error' in response:
+                error_msg = response['error'].get('message', 'Unknown error')
+                logger.error(f"❌ Tool call error: {error_msg}")
+                raise ToolExecutionError(f"Tool execution failed: {error_msg}")
+            
+            if 'result' not in response:
+                raise ToolExecutionError("No result in tool call response")
+            
+            result = response['result']
+            
+            # 세션 사용 시간 업데이트
+            session.last_used_monotonic = time.monotonic()
+            
+            return result
     
     async def get_server_tools(self, server_id: str, server_config: Dict, project_id: Optional[UUID] = None) -> List[Dict]:
         """서버 도구 목록 조회 - stdio/SSE 방식 모두 지원 + 툴 필터링 적용"""
@@ -664,31 +850,22 @@ class McpSessionManager:
         try:
             logger.info(f"🌐 Getting tools from SSE server {server_id}")
             
-            # SSEMCPServer 인스턴스 생성 및 사용
-            from ..core.sse_server import SSEMCPServer, SSEServerConfig
-            
-            # SSE 서버 설정 생성
-            sse_config = SSEServerConfig(
-                name=server_id,
-                url=server_config.get('url', ''),
-                headers=server_config.get('headers', {}),
-                timeout=server_config.get('timeout', 30),
-                disabled=not server_config.get('is_enabled', True)
-            )
-            
-            # SSE 서버 인스턴스 생성
-            sse_server = SSEMCPServer(sse_config)
-            
-            try:
-                # 🆕 일원화된 SSE 처리: 모든 SSE 서버를 독립적인 외부 서버로 처리
-                logger.info(f"🌐 Connecting to SSE server {server_id} at {sse_config.url}")
+            # 세션 가져오기 또는 생성 (도구 목록은 SSE 연결 초기화 시 조회됨)
+            async with self._use_session(server_id, server_config) as session:
+                session.last_used_monotonic = time.monotonic()
                 
-                await sse_server.start(skip_initialization=False)
-                tools = sse_server.tools
+                # 캐시가 무효화되었으면 (도구 목록 변경 등) 풀링된 연결로 다시 조회
+                if session.tools_cache is None:
+                    await session.sse_server._list_tools()
+                    session.tools_cache = list(session.sse_server.tools)
+                    session.filtered_tools_cache = None
+                    logger.info(f"🔄 Refreshed tools cache for SSE server {server_id}")
+                
+                tools = session.tools_cache
                 logger.info(f"✅ Retrieved {len(tools)} tools from SSE server {server_id}")
                 
                 # 🆕 server_id 해석 - project_id.server_id 형식 처리
-                resolved_project_id, actual_server_id = self._resolve_server_id(server_id)
+                resolved_project_id, actual_server_id = await self._resolve_server_id(server_id)
                 
                 # API에서 전달된 project_id가 있으면 우선 사용
                 if project_id and not resolved_project_id:
@@ -706,25 +883,14 @@ class McpSessionManager:
                 # 🆕 도구 필터링 적용
                 filtered_tools = tools
                 if resolved_project_id and actual_server_id:
-                    from .tool_filtering_service import ToolFilteringService
-                    filtered_tools = await ToolFilteringService.filter_tools_by_preferences(
-                        project_id=resolved_project_id,
-                        server_id=actual_server_id,
-                        tools=tools,
-                        db=None  # 세션 매니저에서는 별도 DB 세션 관리
-                    )
+                    filtered_tools = await self._filter_session_tools(session, tools, resolved_project_id, actual_server_id)
                     logger.info(f"🎯 Applied filtering to SSE tools: {len(filtered_tools)}/{len(tools)} tools enabled")
                 else:
                     logger.warning(f"⚠️ Skipping tool filtering due to missing IDs: project_id={resolved_project_id}, server_id={actual_server_id}")
                 
                 logger.info(f"✅ Retrieved {len(filtered_tools)} filtered tools from SSE server {server_id}")
                 return filtered_tools
-                
-            finally:
-                # SSE 서버 정리
-                if sse_server.is_connected:
-                    await sse_server.stop()
-                
+            
         except Exception as e:
             logger.error(f"❌ Error getting tools from SSE server {server_id}: {e}")
             return []
@@ -733,223 +899,285 @@ class McpSessionManager:
         """stdio 서버 도구 목록 조회 (기존 로직)"""
         try:
             # 세션 가져오기 또는 생성
-            session = await self.get_or_create_session(server_id, server_config)
-            
-            # 세션 초기화 (필요시)
-            await self.initialize_session(session)
-            
-            # 🆕 server_id 해석 - project_id.server_id 형식 처리
-            # server_id가 이미 project_id.server_id 형식일 수 있음
-            resolved_project_id, actual_server_id = self._resolve_server_id(server_id)
-            
-            # API에서 전달된 project_id가 있으면 우선 사용
-            if project_id and not resolved_project_id:
-                resolved_project_id = project_id
-                logger.info(f"🔍 [DEBUG] Using API-provided project_id: {resolved_project_id}")
-            
-            logger.info(f"🔍 [DEBUG] Final IDs for stdio server - project_id={resolved_project_id}, server_id={actual_server_id}, original={server_id}")
-            
-            # 캐시된 도구 목록이 있으면 필터링 후 반환
-            if session.tools_cache is not None:
-                logger.info(f"📋 Using cached tools for server {server_id}")
+            async with self._use_session(server_id, server_config) as session:
+                # 세션 초기화 (필요시)
+                await self.initialize_session(session)
+                
+                # 🆕 server_id 해석 - project_id.server_id 형식 처리
+                # server_id가 이미 project_id.server_id 형식일 수 있음
+                resolved_project_id, actual_server_id = await self._resolve_server_id(server_id)
+                
+                # API에서 전달된 project_id가 있으면 우선 사용
+                if project_id and not resolved_project_id:
+                    resolved_project_id = project_id
+                    logger.info(f"🔍 [DEBUG] Using API-provided project_id: {resolved_project_id}")
+                
+                logger.info(f"🔍 [DEBUG] Final IDs for stdio server - project_id={resolved_project_id}, server_id={actual_server_id}, original={server_id}")
+                
+                # 캐시된 도구 목록이 있으면 필터링 후 반환
+                if session.tools_cache is not None:
+                    logger.info(f"📋 Using cached tools for server {server_id}")
+                    
+                    # 🆕 캐시된 도구에 실시간 필터링 적용 (툴 설정이 그대로면 이전 결과 재사용)
+                    if resolved_project_id and actual_server_id:
+                        filtered_tools = await self._filter_session_tools(
+                            session, session.tools_cache, resolved_project_id, actual_server_id
+                        )
+                        logger.info(f"🎯 Applied filtering to cached tools: {len(filtered_tools)}/{len(session.tools_cache)} tools enabled")
+                        return filtered_tools
+                    else:
+                        logger.warning(f"⚠️ Skipping cached tool filtering due to missing IDs: project_id={resolved_project_id}, server_id={actual_server_id}")
+                    
+                    return session.tools_cache
+                
+                # 도구 목록 요청
+                tools_message = {**_TOOLS_LIST_TEMPLATE, "id": self._get_next_message_id()}
+                
+                # 메시지 전송
+                response_future = await self._send_message(session, tools_message)
                 
-                # 🆕 캐시된 도구에 실시간 필터링 적용
+                # 응답 대기 (메시지 ID 매칭)
+                response = await self._read_message(
+                    session, timeout=30, expected_id=tools_message['id'], future=response_future
+                )
+                
+                if not response or response.get('id') != tools_message['id']:
+                    raise Exception("Invalid tools list response")
+                
+                if 'error' in response:
+                    error_msg = response['error'].get('message', 'Unknown error')
+                    raise Exception(f"Tools list failed: {error_msg}")
+                
+                raw_tools = response.get('result', {}).get('tools', [])
+                
+                # 도구 데이터 정규화 (기존 구현과 호환성 유지, inputSchema -> schema 변환)
+                get = dict.get
+                tools = [
+                    {
+                        'name': get(tool, 'name', ''),
+                        'description': get(tool, 'description', ''),
+                        'schema': get(tool, 'inputSchema', {})
+                    }
+                    for tool in raw_tools
+                ]
+                
+                # 🆕 새로 조회한 도구에 필터링 적용
+                session.filtered_tools_cache = None
+                filtered_tools = tools
                 if resolved_project_id and actual_server_id:
-                    from .tool_filtering_service import ToolFilteringService
-                    filtered_tools = await ToolFilteringService.filter_tools_by_preferences(
-                        project_id=resolved_project_id,
-                        server_id=actual_server_id,
-                        tools=session.tools_cache,
-                        db=None  # 세션 매니저에서는 별도 DB 세션 관리
-                    )
-                    logger.info(f"🎯 Applied filtering to cached tools: {len(filtered_tools)}/{len(session.tools_cache)} tools enabled")
-                    return filtered_tools
+                    filtered_tools = await self._filter_session_tools(session, tools, resolved_project_id, actual_server_id)
+                    logger.info(f"🎯 Applied filtering to new tools: {len(filtered_tools)}/{len(tools)} tools enabled")
                 else:
-                    logger.warning(f"⚠️ Skipping cached tool filtering due to missing IDs: project_id={resolved_project_id}, server_id={actual_server_id}")
+                    logger.warning(f"⚠️ Skipping new tool filtering due to missing IDs: project_id={resolved_project_id}, server_id={actual_server_id}")
                 
-                return session.tools_cache
-            
-            # 도구 목록 요청
-            tools_message = {
-                "jsonrpc": "2.0",
-                "id": self._get_next_message_id(),
-                "method": "tools/list",
-                "params": {}
-            }
-            
-            # 메시지 전송
-            await self._send_message(session, tools_message)
-            
-            # 응답 대기 (메시지 ID 매칭)
-            response = await self._read_message(session, timeout=30, expected_id=tools_message['id'])
-            
-            if not response or response.get('id') != tools_message['id']:
-                raise Exception("Invalid tools list response")
-            
-            if 'error' in response:
-                error_msg = response['error'].get('message', 'Unknown error')
-                raise Exception(f"Tools list failed: {error_msg}")
-            
-            raw_tools = response.get('result', {}).get('tools', [])
-            
-            # 도구 데이터 정규화 (기존 구현과 호환성 유지)
-            tools = []
-            for tool in raw_tools:
-                normalized_tool = {
-                    'name': tool.get('name', ''),
-                    'description': tool.get('description', ''),
-                    'schema': tool.get('inputSchema', {})  # inputSchema -> schema 변환
-                }
-                tools.append(normalized_tool)
-            
-            # 🆕 새로 조회한 도구에 필터링 적용
-            filtered_tools = tools
-            if resolved_project_id and actual_server_id:
-                from .tool_filtering_service import ToolFilteringService
-                filtered_tools = await ToolFilteringService.filter_tools_by_preferences(
-                    project_id=resolved_project_id,
-                    server_id=actual_server_id,
-                    tools=tools,
-                    db=None  # 세션 매니저에서는 별도 DB 세션 관리
-                )
-                logger.info(f"🎯 Applied filtering to new tools: {len(filtered_tools)}/{len(tools)} tools enabled")
-            else:
-                logger.warning(f"⚠️ Skipping new tool filtering due to missing IDs: project_id={resolved_project_id}, server_id={actual_server_id}")
-            
-            # 🆕 필터링된 도구를 캐시에 저장 (원본 대신 필터링된 결과)
-            session.tools_cache = filtered_tools
-            session.last_used_at = datetime.utcnow()
-            
-            logger.info(f"📋 Retrieved and cached {len(filtered_tools)} filtered tools for server {server_id}")
-            return filtered_tools
+                # 🆕 원본 도구를 캐시에 저장 - 필터링 결과는 filtered_tools_cache에 설정 버전과 함께 보관
+                #    (원본을 보관해야 비활성화했던 툴을 다시 켰을 때 목록에 복원됨)
+                session.tools_cache = tools
+                session.last_used_monotonic = time.monotonic()
+                
+                logger.info(f"📋 Retrieved and cached {len(filtered_tools)} filtered tools for server {server_id}")
+                return filtered_tools
             
         except Exception as e:
             logger.error(f"❌ Error getting tools for server {server_id}: {e}")
             return []
     
-    async def _send_message(self, session: McpSession, message: Dict) -> None:
-        """메시지 전송"""
+    @staticmethod
+    async def _filter_session_tools(
+        session: McpSession,
+        tools: List[Dict],
+        project_id: Union[str, UUID],
+        server_id: Union[str, UUID]
+    ) -> List[Dict]:
+        """세션 도구 목록에 툴 설정 필터링 적용 - 설정 버전이 같으면 이전 결과 재사용"""
+        prefs_version = await ToolFilteringService.get_prefs_version(project_id, server_id)
+        if (
+            prefs_version is not None
+            and session.filtered_tools_cache is not None
+            and session.tools_cache_prefs_version == prefs_version
+        ):
+            return session.filtered_tools_cache
+        
+        filtered_tools = await ToolFilteringService.filter_tools_by_preferences(
+            project_id=project_id,
+            server_id=server_id,
+            tools=tools,
+            db=None  # 세션 매니저에서는 별도 DB 세션 관리
+        )
+        session.filtered_tools_cache = filtered_tools
+        session.tools_cache_prefs_version = prefs_version
+        return filtered_tools
+    
+    async def _send_message(self, session: McpSession, message: Dict) -> Optional[asyncio.Future]:
+        """메시지 전송 - 요청이면 응답 대기 Future를 전송 전에 등록하고 반환 (알림은 None)"""
+        message_id = message.get('id') if 'method' in message else None
+        future = None
+        if message_id is not None:
+            if session.reader_task is None or session.reader_task.done():
+                raise ToolExecutionError("Connection closed by MCP server")
+            future = session._pending[message_id] = asyncio.get_running_loop().create_future()
+        
         try:
-            message_json = json.dumps(message) + '\n'
-            session.write_stream.write(message_json.encode())
+            # 페이로드와 줄바꿈을 이어붙이지 않고 한 번에 전달 (추가 복사 없음)
+            session.write_stream.writelines((json_codec.dumps(message), b'\n'))
             await session.write_stream.drain()
-            logger.debug(f"📤 Sent message: {message.get('method', message.get('id'))}")
+            logger.debug("📤 Sent message: %s", message.get('method', message.get('id')))
         except Exception as e:
+            if message_id is not None:
+                session._pending.pop(message_id, None)
             logger.error(f"❌ Failed to send message: {e}")
             raise
+        return future
     
-    async def _read_message(self, session: McpSession, timeout: int = 60, expected_id: Optional[int] = None) -> Optional[Dict]:
-        """메시지 읽기 - ID 기반 매칭 지원 (UTF-8 안전 처리)"""
+    async def _read_message(
+        self,
+        session: McpSession,
+        timeout: int = 60,
+        expected_id: Optional[int] = None,
+        future: Optional[asyncio.Future] = None
+    ) -> Optional[Dict]:
+        """
+        메시지 읽기 - 리더 태스크가 분배한 응답을 ID 기반으로 대기
+        
+        future가 있으면 _send_message가 반환한 Future를 직접 기다리고 (리더 종료로
+        _pending이 비워져도 None으로 완료되므로 연결 종료로 처리됨),
+        없으면 서버 알림 큐에서 다음 메시지를 꺼냄. 연결이 닫히면 None 반환.
+        """
         try:
-            # 세션에 읽기 버퍼, 바이트 버퍼, 디코더, 메시지 큐가 없으면 초기화
-            if not hasattr(session, '_read_buffer'):
-                session._read_buffer = ""
-            if not hasattr(session, '_byte_buffer'):
-                session._byte_buffer = b""
-            if not hasattr(session, '_utf8_decoder'):
-                import codecs
-                session._utf8_decoder = codecs.getincrementaldecoder('utf-8')(errors='strict')
-            if not hasattr(session, '_message_queue'):
-                session._message_queue = []
+            if future is None:
+                return await asyncio.wait_for(session._notifications.get(), timeout=timeout)
             
-            # 먼저 큐에서 expected_id와 일치하는 메시지 찾기
-            if expected_id is not None:
-                for i, queued_message in enumerate(session._message_queue):
-                    if queued_message.get('id') == expected_id:
-                        # 일치하는 메시지 발견, 큐에서 제거하고 반환
-                        return session._message_queue.pop(i)
+            try:
+                return await asyncio.wait_for(future, timeout=timeout)
+            finally:
+                if session._pending.get(expected_id) is future:
+                    del session._pending[expected_id]
             
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Message read timeout after {timeout} seconds")
+            raise ToolExecutionError(f"Message read timeout after {timeout} seconds")
+        except Exception as e:
+            logger.error(f"❌ Error reading message: {e}")
+            raise
+    
+    async def _demux_loop(self, session: McpSession) -> None:
+        """
+        세션 stdout 단일 리더 - 수신 메시지를 메시지 ID별 Future로 분배
+        
+        바이트 단위로 줄바꿈을 찾아 완성된 프레임만 잘라내므로 청크 경계에 걸친
+        멀티바이트 UTF-8 문자도 별도 처리 없이 안전함 (디코딩은 프레임 단위로 수행).
+        """
+        buffer = session._read_buffer
+        
+        try:
             while True:
-                # 완전한 라인이 버퍼에 있는지 먼저 확인
-                if '\n' in session._read_buffer:
-                    lines = session._read_buffer.split('\n')
-                    session._read_buffer = lines.pop()  # 마지막 불완전한 라인은 버퍼에 유지
-                    
-                    # 모든 완전한 라인 처리
-                    for line_text in lines:
-                        line_text = line_text.strip()
-                        if line_text:
-                            try:
-                                response = json.loads(line_text)
-                                logger.debug(f"📥 Received message ({len(line_text)} bytes): {response.get('method', response.get('id'))}")
-                                logger.debug(f"📥 Message content: {response}")
-                                
-                                # expected_id가 지정되었고 일치하면 즉시 반환
-                                if expected_id is not None and response.get('id') == expected_id:
-                                    return response
-                                # expected_id가 지정되지 않았으면 첫 번째 메시지 반환
-                                elif expected_id is None:
-                                    return response
-                                # ID가 일치하지 않으면 큐에 저장
-                                else:
-                                    session._message_queue.append(response)
-                                    logger.debug(f"📦 Queued message ID {response.get('id')}, waiting for ID {expected_id}")
-                                    
-                            except json.JSONDecodeError as e:
-                                logger.error(f"❌ JSON decode error: {e}")
-                                logger.error(f"❌ Invalid JSON content: {line_text[:500]}...")
-                                # JSON 파싱 오류는 무시하고 다음 라인 처리
-                                continue
-                
-                # MCP SDK와 동일한 패턴: 청크 기반 읽기 (UTF-8 안전 처리)
-                chunk = await asyncio.wait_for(
-                    session.read_stream.read(8192),  # 8KB 청크 크기
-                    timeout=timeout
-                )
+                chunk = await session.read_stream.read(STDIO_READ_CHUNK_SIZE)
                 
                 if not chunk:
                     # 연결이 닫혔을 때
                     logger.warning("⚠️ Connection closed by MCP server")
-                    return None
+                    return
                 
-                # 바이트 버퍼에 새 청크 추가
-                session._byte_buffer += chunk
+                # 이전 버퍼는 이미 검사했으므로 새 청크 구간부터 줄바꿈 탐색
+                scan_from = len(buffer)
+                buffer.extend(chunk)
+                newline = buffer.find(b'\n', scan_from)
                 
-                # 증분 디코더로 안전하게 UTF-8 디코딩
-                try:
-                    # 가능한 한 많은 바이트를 디코딩하고, 불완전한 멀티바이트 문자는 버퍼에 유지
-                    decoded_text = session._utf8_decoder.decode(session._byte_buffer, final=False)
-                    session._byte_buffer = b""  # 성공적으로 디코딩된 바이트는 제거
-                    
-                    # 디코딩된 텍스트를 문자열 버퍼에 추가
-                    session._read_buffer += decoded_text
-                    
-                except UnicodeDecodeError as decode_error:
-                    # 불완전한 멀티바이트 문자가 청크 끝에 있을 경우
-                    # 다음 청크를 읽어서 완성할 때까지 바이트 버퍼에 유지
-                    logger.debug(f"📦 Incomplete UTF-8 sequence at chunk boundary, buffering: {len(session._byte_buffer)} bytes")
-                    continue
-            
-        except asyncio.TimeoutError:
-            logger.error(f"❌ Message read timeout after {timeout} seconds")
-            raise ToolExecutionError(f"Message read timeout after {timeout} seconds")
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Invalid JSON response: {e}")
-            logger.error(f"❌ Raw message: {line_text[:500]}..." if 'line_text' in locals() else "❌ No line_text available")
-            raise ToolExecutionError(f"Invalid JSON response: {e}")
-        except UnicodeDecodeError as e:
-            logger.error(f"❌ Critical UTF-8 encoding error: {e}")
-            logger.error(f"❌ Byte buffer length: {len(getattr(session, '_byte_buffer', b''))}")
-            logger.error(f"❌ Read buffer length: {len(getattr(session, '_read_buffer', ''))}")
-            raise ToolExecutionError(f"Critical UTF-8 encoding error: {e}")
-        except Exception as e:
-            logger.error(f"❌ Error reading message: {e}")
+                # 완전한 라인 처리 - 앞부분 삭제는 bytearray에서 복사 없이 수행됨
+                while newline != -1:
+                    # 프레임은 bytearray 그대로 파서에 전달 (앞뒤 공백/\r은 JSON 파서가 허용)
+                    line = buffer[:newline]
+                    del buffer[:newline + 1]
+                    if line and not line.isspace():
+                        self._dispatch_message(session, line)
+                    newline = buffer.find(b'\n')
+                
+        except asyncio.CancelledError:
             raise
+        except Exception as e:
+            logger.error(f"❌ Error reading messages for server {session.server_id}: {e}")
+        finally:
+            # 대기 중인 요청은 응답 없음(None)으로 완료
+            for future in session._pending.values():
+                if not future.done():
+                    future.set_result(None)
+            session._pending.clear()
     
-    async def _is_session_alive(self, session: McpSession) -> bool:
-        """세션이 살아있는지 확인 - stdio/SSE 모두 지원"""
+    def _dispatch_message(self, session: McpSession, line: bytearray) -> None:
+        """수신한 JSON-RPC 메시지 한 줄을 대기 중인 요청 또는 알림 큐로 전달"""
+        try:
+            message = json_codec.loads(line)
+        except json_codec.JSONDecodeError as e:
+            logger.error(f"❌ JSON decode error: {e}")
+            logger.error(f"❌ Invalid JSON content: {line[:500].decode('utf-8', 'replace')}...")
+            # JSON 파싱 오류는 무시하고 다음 라인 처리
+            return
+        
+        if not isinstance(message, dict):
+            logger.warning(f"⚠️ Ignoring non-object JSON-RPC message: {line[:100].decode('utf-8', 'replace')}")
+            return
+        
+        logger.debug("📥 Received message (%d bytes): %s", len(line), message.get('method', message.get('id')))
+        logger.debug("📥 Message content: %s", message)
+        
+        # 응답(method 없음)은 ID로 대기 중인 Future에 전달 - 대기자가 없으면(타임아웃 등) 버림
+        if 'method' not in message:
+            message_id = message.get('id')
+            future = session._pending.get(message_id)
+            if future is not None:
+                if not future.done():
+                    future.set_result(message)
+            elif 'error' in message:
+                logger.warning(f"⚠️ Unmatched error response (ID: {message_id}) from server {session.server_id}: {message['error']}")
+            else:
+                logger.debug("📭 Dropping response for unknown or expired message ID %s", message_id)
+            return
+        
+        # 서버 알림/요청은 알림 큐에 보관
+        if session._notifications.full():
+            session._notifications.get_nowait()
+        session._notifications.put_nowait(message)
+        logger.debug("📦 Queued unsolicited message: %s", message.get('method', message.get('id')))
+    
+    async def _is_session_alive(self, session: McpSession, deep: bool = False) -> bool:
+        """
+        세션이 살아있는지 확인 - stdio/SSE 모두 지원
+        
+        기본 확인은 프로세스 종료 코드/리더 태스크 상태만 보는 메모리 내 검사이며,
+        deep=True이면 유휴 stdio 세션에 ping 요청을 보내 실제 응답 여부까지 확인.
+        """
         try:
             # SSE 세션의 경우 process가 None이므로 다르게 처리
             if session.process is None:
-                # SSE 세션은 항상 "alive"로 간주 (실제 연결 테스트는 요청 시점에)
-                return True
+                # SSE 세션은 SSE 스트림 태스크가 실행 중이고 연결되어 있는 동안 "alive"로 간주
+                sse_server = session.sse_server
+                if sse_server is None or sse_server.sse_task is None or sse_server.sse_task.done():
+                    return False
+                return sse_server.is_connected
             
             # stdio 세션의 경우 프로세스 상태 확인
             if session.process.returncode is not None:
                 return False
             
-            # 간단한 ping 메시지로 확인 (선택적)
-            return True
+            # stdout 리더가 종료되었으면 더 이상 응답을 받을 수 없음
+            if session.reader_task is None or session.reader_task.done():
+                return False
+            
+            # 처리 중인 요청이 있으면 ping 응답이 늦을 수 있으므로 생략
+            if not deep or session._pending:
+                return True
+            
+            ping_message = {
+                "jsonrpc": "2.0",
+                "id": self._get_next_message_id(),
+                "method": "ping"
+            }
+            ping_future = await self._send_message(session, ping_message)
+            # 오류 응답이어도 서버가 응답했으면 살아있는 것으로 간주
+            response = await self._read_message(
+                session, timeout=SESSION_PING_TIMEOUT_SECONDS, expected_id=ping_message['id'], future=ping_future
+            )
+            return response is not None
             
         except Exception:
             return False
@@ -959,8 +1187,18 @@ class McpSessionManager:
         try:
             logger.info(f"🔴 Closing session for server {session.server_id}")
             
+            # stdout 리더 종료 (대기 중인 요청은 None으로 완료됨)
+            if session.reader_task is not None and not session.reader_task.done():
+                session.reader_task.cancel()
+                try:
+                    await session.reader_task
+                except asyncio.CancelledError:
+                    pass
+            
             # SSE 세션의 경우 process가 None이므로 별도 처리
             if session.process is None:
+                if session.sse_server is not None:
+                    await session.sse_server.stop()
                 logger.info(f"🌐 SSE session closed for server {session.server_id}")
             else:
                 # stdio 세션의 경우 프로세스 종료
@@ -981,79 +1219,135 @@ class McpSessionManager:
                     pass
             
             # 버퍼 정리
-            if hasattr(session, '_read_buffer'):
-                session._read_buffer = ""
-            if hasattr(session, '_byte_buffer'):
-                session._byte_buffer = b""
-            if hasattr(session, '_utf8_decoder'):
-                session._utf8_decoder = None
-            if hasattr(session, '_message_queue'):
-                session._message_queue.clear()
+            session._read_buffer.clear()
+            session._pending.clear()
             
         except Exception as e:
             logger.error(f"❌ Error closing session for {session.server_id}: {e}")
         
         # 🔄 서버 상태 자동 업데이트: MCP 세션 종료 시 INACTIVE로 설정
         try:
-            # server_id에서 프로젝트 ID 추출 (server_id가 "project_id.server_name" 형태인 경우)
-            if '.' in session.server_id:
-                project_id_str, server_name = session.server_id.split('.', 1)
-                project_id = UUID(project_id_str)
-                
+            # server_id가 "project_id.server_name" 형태인 경우에만 (세션 생성 시 분리해 둔 값 사용)
+            if session.project_uuid is not None:
                 await ServerStatusService.update_server_status_on_connection(
                     server_id=session.server_id,
-                    project_id=project_id,
+                    project_id=session.project_uuid,
                     status=McpServerStatus.INACTIVE,
                     connection_type="MCP_SESSION_CLOSE"
                 )
         except Exception as e:
             logger.error(f"❌ Failed to update server status on MCP session close: {e}")
     
+    def _schedule_expiry(self, session_key: str, session: McpSession) -> None:
+        """세션을 만료 힙에 등록 (세션 생성 시 한 번만 호출)"""
+        session.generation = next(self._session_generation)
+        heapq.heappush(
+            self._expiry_heap,
+            (session.last_used_monotonic + self.session_timeout_seconds, session_key, session.generation)
+        )
+    
+    def _seconds_until_next_expiry(self) -> float:
+        """다음 만료 예정 시각까지 남은 시간 (힙이 비어 있으면 정리 주기)"""
+        if not self._expiry_heap:
+            return self.cleanup_interval_seconds
+        remaining = self._expiry_heap[0][0] - time.monotonic()
+        return min(max(0.0, remaining), self.cleanup_interval_seconds)
+    
+    def _pop_expired_sessions(self, now: float) -> List[Tuple[str, McpSession]]:
+        """
+        Pop heap entries that are due and return (key, session) pairs of truly expired sessions
+        
+        Entries for replaced/closed sessions are dropped; sessions used since
+        their entry was pushed are rescheduled at their real expiry time.
+        """
+        expired_sessions = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, server_id, generation = heapq.heappop(self._expiry_heap)
+            session = self.sessions.get(server_id)
+            if session is None or session.generation != generation:
+                continue
+            
+            expires_at = session.last_used_monotonic + self.session_timeout_seconds
+            if expires_at > now:
+                heapq.heappush(self._expiry_heap, (expires_at, server_id, generation))
+            else:
+                expired_sessions.append((server_id, session))
+        return expired_sessions
+    
     async def _cleanup_expired_sessions(self) -> None:
         """
         Clean up expired sessions (background task)
         
-        Runs periodically based on cleanup_interval_minutes configuration
+        Sleeps until the earliest scheduled expiry (at most cleanup_interval_minutes)
+        and closes sessions whose expiry time has been reached. Sessions whose
+        process or connection has died are reaped by a deep liveness sweep that
+        runs once per cleanup_interval_minutes, not on every expiry wake-up.
+        Liveness checks and closes run concurrently.
         """
+        next_sweep = time.monotonic() + self.cleanup_interval_seconds
         while True:
             try:
-                # Use configured cleanup interval (convert minutes to seconds)
-                cleanup_seconds = int(self.cleanup_interval.total_seconds())
-                await asyncio.sleep(cleanup_seconds)
+                await asyncio.sleep(min(
+                    self._seconds_until_next_expiry(),
+                    max(0.0, next_sweep - time.monotonic())
+                ))
                 
-                now = datetime.utcnow()
-                expired_sessions = []
+                now = time.monotonic()
+                expired_sessions = self._pop_expired_sessions(now)
+                dead_sessions: List[str] = []
                 
-                for server_id, session in self.sessions.items():
-                    if now - session.last_used_at > self.session_timeout:
-                        expired_sessions.append(server_id)
+                # 만료되지 않은 세션 중 프로세스/연결이 끊어진 세션은 정리 주기마다 한 번만 확인 (ping은 동시 수행)
+                if now >= next_sweep:
+                    next_sweep = now + self.cleanup_interval_seconds
+                    expired_keys = {key for key, _ in expired_sessions}
+                    candidates = [(key, session) for key, session in self.sessions.items() if key not in expired_keys]
+                    alive = await asyncio.gather(*(self._is_session_alive(session, deep=True) for _, session in candidates))
+                    dead_sessions = [candidate for candidate, is_alive in zip(candidates, alive) if not is_alive]
                 
-                for server_id in expired_sessions:
-                    session = self.sessions.pop(server_id, None)
-                    if session:
-                        await self._close_session(session)
-                        logger.info(f"🧹 Cleaned up expired session for server {server_id}")
-                        
-                        # 🔄 만료된 세션에 대한 추가 상태 업데이트
-                        try:
-                            if '.' in server_id:
-                                project_id_str, server_name = server_id.split('.', 1)
-                                project_id = UUID(project_id_str)
-                                
-                                await ServerStatusService.update_server_status_on_connection(
-                                    server_id=server_id,
-                                    project_id=project_id,
-                                    status=McpServerStatus.INACTIVE,
-                                    connection_type="MCP_SESSION_EXPIRED"
-                                )
-                        except Exception as e:
-                            logger.error(f"❌ Failed to update server status on session expiry: {e}")
+                await asyncio.gather(
+                    *(self._expire_session(server_id, session) for server_id, session in expired_sessions),
+                    *(self._expire_session(server_id, session, idle_only=False) for server_id, session in dead_sessions),
+                    return_exceptions=True
+                )
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"❌ Error during session cleanup: {e}")
     
+    async def _expire_session(self, server_id: str, session: McpSession, idle_only: bool = True) -> None:
+        """
+        만료되었거나 죽은 세션 종료 및 서버 상태 업데이트
+        
+        서버별 락 안에서 등록된 세션이 여전히 같은 객체인지 확인한 뒤 종료하므로,
+        생존 확인 중에 재생성된 세션은 건드리지 않음. idle_only이면 그 사이 사용된 세션은 다시 예약.
+        """
+        async with self._server_lock(server_id):
+            if self.sessions.get(server_id) is not session:
+                return
+            
+            if idle_only:
+                expires_at = session.last_used_monotonic + self.session_timeout_seconds
+                if expires_at > time.monotonic():
+                    heapq.heappush(self._expiry_heap, (expires_at, server_id, session.generation))
+                    return
+            
+            del self.sessions[server_id]
+            await self._close_session(session)
+        logger.info(f"🧹 Cleaned up expired session for server {server_id}")
+        
+        # 🔄 만료된 세션에 대한 추가 상태 업데이트
+        try:
+            if session.project_uuid is not None:
+                await ServerStatusService.update_server_status_on_connection(
+                    server_id=server_id,
+                    project_id=session.project_uuid,
+                    status=McpServerStatus.INACTIVE,
+                    connection_type="MCP_SESSION_EXPIRED"
+                )
+        except Exception as e:
+            logger.error(f"❌ Failed to update server status on session expiry: {e}")
+    
     async def _save_tool_call_log(
         self,
         db: Session,
@@ -1064,7 +1358,42 @@ class McpSessionManager:
         error_message: Optional[str] = None,
         error_code: Optional[str] = None
     ):
-        """ToolCallLog 데이터베이스에 저장"""
+        """
+        ToolCallLog 저장 요청
+        
+        매니저가 실행 중이면 행을 대기열에 넣고 즉시 반환 (백그라운드 작성기가 별도
+        DB 세션으로 배치 저장). 실행 중이 아니면 전달된 db 세션으로 바로 저장.
+        """
+        row = {
+            'session_id': log_data.get('session_id'),
+            'server_id': log_data.get('server_id'),
+            'project_id': log_data.get('project_id'),
+            'tool_name': log_data.get('tool_name'),
+            'tool_namespace': f"{log_data.get('server_id')}.{log_data.get('tool_name')}",
+            'arguments': log_data.get('arguments'),
+            'result': output_data.get('result') if output_data else None,
+            'error_message': error_message or (output_data.get('error') if output_data else None),
+            'error_code': error_code,
+            'execution_time_ms': int(execution_time),  # 밀리초 단위로 저장 (DB 스키마에 맞춰)
+            'status': status,
+            'user_agent': log_data.get('user_agent'),
+            'ip_address': log_data.get('ip_address'),
+            'created_at': log_data.get('timestamp')
+        }
+        # server_id는 NOT NULL - 해석에 실패한 행은 대기열에 넣지 않고 건너뜀 (배치 전체 실패 방지)
+        if row['server_id'] is None:
+            logger.warning(f"⚠️ Skipping ToolCallLog for tool {row['tool_name']}: server_id could not be resolved")
+            return
+        
+        logger.debug("🔍 Queueing ToolCallLog: server_id=%s, project_id=%s, tool=%s (%s)", row['server_id'], row['project_id'], row['tool_name'], status.value)
+        
+        if self._log_writer is not None:
+            try:
+                self._log_queue.put_nowait(row)
+            except asyncio.QueueFull:
+                logger.warning(f"⚠️ ToolCallLog queue full, dropping log for tool {row['tool_name']}")
+            return
+        
         try:
             # 데이터베이스 세션 타입 검증
             if db is None:
@@ -1075,26 +1404,7 @@ class McpSessionManager:
                 logger.error(f"❌ Invalid database session type: {type(db)}, expected SQLAlchemy Session")
                 return
             
-            # 저장할 데이터 로깅
-            logger.info(f"🔍 Saving ToolCallLog: server_id={log_data.get('server_id')} (type: {type(log_data.get('server_id'))}), project_id={log_data.get('project_id')}, tool={log_data.get('tool_name')}")
-            
-            tool_call_log = ToolCallLog(
-                session_id=log_data.get('session_id'),
-                server_id=log_data.get('server_id'),
-                project_id=log_data.get('project_id'),
-                tool_name=log_data.get('tool_name'),
-                tool_namespace=f"{log_data.get('server_id')}.{log_data.get('tool_name')}",
-                arguments=log_data.get('arguments'),
-                result=output_data.get('result') if output_data else None,
-                error_message=error_message or (output_data.get('error') if output_data else None),
-                error_code=error_code,
-                execution_time_ms=int(execution_time),  # 밀리초 단위로 저장 (DB 스키마에 맞춰)
-                status=status,
-                user_agent=log_data.get('user_agent'),
-                ip_address=log_data.get('ip_address'),
-                created_at=log_data.get('timestamp')
-            )
-            
+            tool_call_log = ToolCallLog(**row)
             db.add(tool_call_log)
             db.commit()
             
@@ -1105,6 +1415,84 @@ class McpSessionManager:
             logger.error(f"❌ Log data: {log_data}")
             logger.error(f"❌ Output data: {output_data}")
             db.rollback()
+    
+    async def _drain_tool_call_logs(self) -> None:
+        """
+        ToolCallLog 백그라운드 작성기
+        
+        첫 행이 들어오면 최대 TOOL_CALL_LOG_FLUSH_INTERVAL초 동안 추가 행을 모아
+        TOOL_CALL_LOG_BATCH_SIZE개 단위로 한 트랜잭션에 저장 (호출마다 커밋하지 않음).
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            rows: List[Dict] = []
+            try:
+                rows.append(await self._log_queue.get())
+                deadline = loop.time() + TOOL_CALL_LOG_FLUSH_INTERVAL
+                while len(rows) < TOOL_CALL_LOG_BATCH_SIZE:
+                    if not self._log_queue.empty():
+                        rows.append(self._log_queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        rows.append(await asyncio.wait_for(self._log_queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                # 저장을 넘긴 뒤 취소되어도 중복 저장하지 않도록 먼저 비움
+                batch, rows = rows, []
+                await asyncio.to_thread(self._insert_tool_call_logs, batch)
+                
+            except asyncio.CancelledError:
+                # 모으던 행은 종료 전에 저장 (대기열에 남은 행은 stop_manager가 저장)
+                if rows:
+                    await asyncio.to_thread(self._insert_tool_call_logs, rows)
+                break
+            except Exception as e:
+                logger.error(f"❌ Error in ToolCallLog writer: {e}")
+    
+    async def _flush_tool_call_logs(self) -> None:
+        """대기열에 남은 ToolCallLog 행을 모두 저장 (매니저 종료 시)"""
+        rows = []
+        while not self._log_queue.empty():
+            rows.append(self._log_queue.get_nowait())
+        
+        for start in range(0, len(rows), TOOL_CALL_LOG_BATCH_SIZE):
+            await asyncio.to_thread(self._insert_tool_call_logs, rows[start:start + TOOL_CALL_LOG_BATCH_SIZE])
+    
+    def _insert_tool_call_logs(self, rows: List[Dict]) -> None:
+        """
+        ToolCallLog 행 일괄 INSERT (워커 스레드에서 실행, 전용 DB 세션 사용)
+        
+        일괄 INSERT가 실패하면 롤백 후 한 행씩 다시 저장하여 정상 행은 잃지 않도록 함.
+        (server_id가 없는 행은 _save_tool_call_log에서 대기열에 넣기 전에 걸러짐)
+        """
+        from ..database import get_db
+        db = next(get_db())
+        try:
+            try:
+                db.bulk_insert_mappings(ToolCallLog, rows)
+                db.commit()
+                logger.info(f"✅ Saved {len(rows)} ToolCallLog entries")
+                return
+            except Exception as e:
+                logger.error(f"❌ Failed to save {len(rows)} ToolCallLog entries, retrying one by one: {e}")
+                db.rollback()
+            
+            saved = 0
+            for row in rows:
+                try:
+                    db.bulk_insert_mappings(ToolCallLog, [row])
+                    db.commit()
+                    saved += 1
+                except Exception as e:
+                    logger.error(f"❌ Failed to save ToolCallLog for tool {row.get('tool_name')}: {e}")
+                    db.rollback()
+            logger.info(f"✅ Saved {saved}/{len(rows)} ToolCallLog entries")
+        finally:
+            db.close()
 
 
 # 글로벌 세션 매니저 인스턴스
@@ -4,10 +4,12 @@ Tool Filtering Service - 프로젝트별 툴 사용 설정 관리
 ServerStatusService 패턴을 적용한 일관된 DB 세션 관리 및 로깅 시스템
 """
 
+import itertools
 import logging
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, FrozenSet, Tuple, Union
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
@@ -17,6 +19,61 @@ from ..database import get_db
 
 logger = logging.getLogger(__name__)
 
+# 비활성화 툴 이름 캐시 설정 (설정 변경 시 invalidate_cache로 즉시 무효화, TTL은 안전장치)
+FILTER_PREFS_CACHE_TTL_SECONDS = 60
+FILTER_PREFS_CACHE_MAX_ENTRIES = 4096
+
+
+class _FilterPrefsCache:
+    """
+    (project_id, server_id)별 비활성화 툴 이름 집합의 LRU + TTL 캐시
+    
+    툴 설정은 명시적으로 비활성화된 툴만 의미가 있으므로(기본값: 사용함)
+    비활성화된 이름 집합만 저장함. 항목마다 로드 시점의 버전 번호를 함께 저장하여,
+    호출측이 버전 비교만으로 이전 필터링 결과의 재사용 여부를 판단할 수 있음.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, int, FrozenSet[str]]]" = OrderedDict()
+        # 무효화 세대 - 조회 도중 무효화된 경우 오래된 결과 저장 방지
+        self.generation = 0
+        # 설정 버전 발급기 - DB에서 새로 로드할 때마다 증가 (무효화/TTL 만료 후 재로드 시 버전 변경)
+        self.next_version = itertools.count(1).__next__
+    
+    @staticmethod
+    def key(project_id: Union[UUID, str], server_id: Union[UUID, str]) -> Tuple[str, str]:
+        return str(project_id), str(server_id)
+    
+    def get(self, key: Tuple[str, str]) -> Optional[Tuple[int, FrozenSet[str]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cached_at, version, disabled_tools = entry
+        if time.monotonic() - cached_at >= self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return version, disabled_tools
+    
+    def put(self, key: Tuple[str, str], version: int, disabled_tools: FrozenSet[str], generation: int) -> None:
+        if generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic(), version, disabled_tools)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, project_id: Union[UUID, str], server_id: Optional[Union[UUID, str]] = None) -> None:
+        self.generation += 1
+        if server_id is not None:
+            self._entries.pop(self.key(project_id, server_id), None)
+            return
+        project_key = str(project_id)
+        for key in [key for key in self._entries if key[0] == project_key]:
+            del self._entries[key]
+
 
 class ToolFilteringService:
     """공통 툴 필터링 서비스 - Unified/Individual MCP Transport 모두 사용"""
@@ -48,54 +105,12 @@ class ToolFilteringService:
             logger.info(f"🔧 [DEBUG] Tool filtering disabled by environment variable - returning all {len(tools)} tools")
             return tools
         
-        # 🔄 ServerStatusService와 동일한 DB 세션 관리 패턴
-        should_close_db = False
-        if db is None:
-            db = next(get_db())
-            should_close_db = True
-        
         try:
-            # 🔍 디버깅: 입력 매개변수 로깅
-            logger.info(f"🔍 [DEBUG] Filtering tools for project_id={project_id}, server_id={server_id}, tool_count={len(tools)}")
-            if tools:
-                tool_names = [tool.get('name', 'unknown') for tool in tools[:3]]
-                logger.info(f"🔍 [DEBUG] Sample tool names: {tool_names}")
-            
-            # 툴 설정 조회 (배치 쿼리 최적화)
-            tool_preferences = db.query(ToolPreference).filter(
-                and_(
-                    ToolPreference.project_id == project_id,
-                    ToolPreference.server_id == server_id
-                )
-            ).all()
+            _, disabled_tools = await ToolFilteringService._load_disabled_tool_names(project_id, server_id, db)
             
-            # 🔍 디버깅: 조회된 설정 로깅
-            logger.info(f"🔍 [DEBUG] Found {len(tool_preferences)} tool preferences in database")
-            for pref in tool_preferences[:5]:  # 처음 5개만 로깅
-                logger.info(f"🔍 [DEBUG] Preference: {pref.tool_name} = {pref.is_enabled}")
-            
-            # 빠른 조회를 위한 설정 맵 생성
-            preference_map = {
-                pref.tool_name: pref.is_enabled
-                for pref in tool_preferences
-            }
-            
-            # 필터링 적용
-            filtered_tools = []
-            filtered_count = 0
-            
-            for tool in tools:
-                tool_name = tool.get('name', '')
-                is_enabled = preference_map.get(tool_name, True)  # 기본값: 사용함
-                
-                # 🔍 디버깅: 각 도구별 결정 로깅
-                logger.debug(f"🔍 [DEBUG] Tool '{tool_name}': preference={preference_map.get(tool_name, 'default_true')}, enabled={is_enabled}")
-                
-                if is_enabled:
-                    filtered_tools.append(tool)
-                else:
-                    filtered_count += 1
-                    logger.info(f"🚫 Tool filtered: {tool_name} from server {server_id} (explicitly disabled)")
+            # 필터링 적용 (설정이 없는 툴은 기본값: 사용함)
+            filtered_tools = [tool for tool in tools if tool.get('name', '') not in disabled_tools]
+            filtered_count = len(tools) - len(filtered_tools)
             
             # 📊 ServerStatusService 스타일 메트릭 로깅
             filtering_time = (time.time() - start_time) * 1000  # 밀리초
@@ -112,6 +127,68 @@ class ToolFilteringService:
             logger.error(f"❌ [TOOL_FILTERING] Error filtering tools for server {server_id}: {e} (took {filtering_time:.2f}ms)")
             # 🛡️ ServerStatusService 스타일 안전장치: 에러 시 원본 툴 목록 반환
             return tools
+    
+    @staticmethod
+    async def get_prefs_version(
+        project_id: UUID,
+        server_id: UUID,
+        db: Session = None
+    ) -> Optional[int]:
+        """
+        서버 툴 설정의 현재 버전 조회 (캐시 우선)
+        
+        설정이 변경(무효화)되거나 캐시가 만료되어 다시 로드되면 버전이 바뀌므로,
+        같은 버전으로 필터링한 결과는 그대로 재사용할 수 있음.
+        
+        Args:
+            project_id: 프로젝트 ID
+            server_id: MCP 서버 ID
+            db: 데이터베이스 세션 (선택적, 캐시 미스 시에만 사용)
+            
+        Returns:
+            설정 버전 (조회 실패 시 None - 호출측은 매번 필터링해야 함)
+        """
+        try:
+            version, _ = await ToolFilteringService._load_disabled_tool_names(project_id, server_id, db)
+            return version
+        except Exception as e:
+            logger.error(f"❌ [TOOL_FILTERING] Error loading preference version for server {server_id}: {e}")
+            return None
+    
+    @staticmethod
+    async def _load_disabled_tool_names(
+        project_id: UUID,
+        server_id: UUID,
+        db: Session = None
+    ) -> Tuple[int, FrozenSet[str]]:
+        """비활성화된 툴 이름 집합과 그 로드 버전 조회 - 캐시 미스 시 DB에서 로드"""
+        cache_key = _FilterPrefsCache.key(project_id, server_id)
+        cached = _filter_prefs_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        generation = _filter_prefs_cache.generation
+        
+        # 🔄 ServerStatusService와 동일한 DB 세션 관리 패턴
+        should_close_db = False
+        if db is None:
+            db = next(get_db())
+            should_close_db = True
+        
+        try:
+            disabled_rows = db.query(ToolPreference.tool_name).filter(
+                and_(
+                    ToolPreference.project_id == project_id,
+                    ToolPreference.server_id == server_id,
+                    ToolPreference.is_enabled.is_(False)
+                )
+            ).all()
+            disabled_tools = frozenset(row.tool_name for row in disabled_rows)
+            version = _filter_prefs_cache.next_version()
+            
+            logger.debug(f"🔍 [TOOL_FILTERING] Loaded {len(disabled_tools)} disabled tools for server {server_id} in project {project_id}")
+            _filter_prefs_cache.put(cache_key, version, disabled_tools, generation)
+            return version, disabled_tools
             
         finally:
             if should_close_db:
@@ -218,6 +295,7 @@ class ToolFilteringService:
                 logger.info(f"📝 [TOOL_FILTERING] Created new tool preference: {tool_name} (enabled={is_enabled}) for server {server_id}")
             
             db.commit()
+            _filter_prefs_cache.invalidate(project_id, server_id)
             
             # 📊 ServerStatusService 스타일 메트릭 로깅
             logger.info(f"📈 [METRICS] Tool preference updated: {project_id}/{server_id}/{tool_name} = {is_enabled}")
@@ -294,14 +372,16 @@ class ToolFilteringService:
         server_id: Optional[UUID] = None
     ):
         """
-        툴 필터링 캐시 무효화 (향후 캐싱 시스템 연동용)
+        툴 필터링 캐시 무효화
         
         Args:
             project_id: 프로젝트 ID
             server_id: 서버 ID (None이면 프로젝트 전체)
         """
         try:
-            # 현재는 로깅만, 향후 Redis나 Materialized View 연동 시 확장
+            # 프로세스 내 비활성화 툴 캐시 무효화 (Redis나 Materialized View 연동 시 확장)
+            _filter_prefs_cache.invalidate(project_id, server_id)
+            
             if server_id:
                 logger.info(f"🔄 [CACHE] Tool filtering cache invalidated for server {server_id} in project {project_id}")
             else:
@@ -311,9 +391,12 @@ class ToolFilteringService:
             logger.info(f"📈 [METRICS] Cache invalidation completed for project {project_id}")
             
             # TODO: 향후 구현 예정
-            # - MCP 세션 매니저 캐시 무효화
             # - Materialized View 새로고침
             # - 활성 SSE 연결에 업데이트 알림
             
         except Exception as e:
-            logger.error(f"❌ [CACHE] Cache invalidation failed: {e}")
\ No newline at end of file
+            logger.error(f"❌ [CACHE] Cache invalidation failed: {e}")
+
+
+# 프로세스 전역 비활성화 툴 캐시
+_filter_prefs_cache = _FilterPrefsCache(FILTER_PREFS_CACHE_TTL_SECONDS, FILTER_PREFS_CACHE_MAX_ENTRIES)
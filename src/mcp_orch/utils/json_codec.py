@@ -0,0 +1,34 @@
+"""
+JSON 코덱 유틸리티
+MCP JSON-RPC 메시지 직렬화를 위한 orjson 우선, 표준 json 폴백 래퍼
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스이므로 둘 다 이 타입으로 처리됨
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """JSON 바이트 또는 문자열을 역직렬화"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if not isinstance(data, str):
+        try:
+            data = bytes(data).decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise JSONDecodeError(f"Invalid UTF-8: {e}", "", 0) from e
+    return json.loads(data)